@@ -1,21 +1,65 @@
 import discord
 from discord.ext import commands, tasks
 import asyncio
+import hashlib
+import json
 import logging
+import queue
+import sys
+from datetime import datetime, timedelta, timezone
+from logging.handlers import QueueHandler, QueueListener
+try:
+    import uvloop
+except ImportError:  # Not available on Windows — fall back to the default loop
+    uvloop = None
 from config import Config
-from services import db_connection, initialize_database, event_population_service
+from services import db_connection, initialize_database, event_population_service, bot_state_repository
 from services.log_channel_service import report_failure
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+from services.permission_service import invalidate_editor_role
+from services.bot_state_repository import COMMAND_SYNC_HASH_KEY_PREFIX, EVENT_MAINTENANCE_KEY
+from services.rate_limiter import discord_rate_limiter
+
+# Configure logging — the event loop only enqueues records; the stream
+# write happens on the QueueListener's background thread.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 )
+_log_listener = QueueListener(_log_queue, _log_stream_handler)
+logging.getLogger().setLevel(logging.INFO)
+logging.getLogger().addHandler(QueueHandler(_log_queue))
+_log_listener.start()
 logger = logging.getLogger(__name__)
 
+# Command Cogs loaded in setup_hook
+COMMAND_EXTENSIONS = [
+    'commands.schedule_commands',
+    'commands.ping_command',
+    'commands.configure_command',
+    'commands.populate_command',
+    'commands.mission_poll_command',
+    'commands.cancel_poll_command',
+    'commands.loa_command',
+    'commands.roster_command',
+    'commands.feedback_command',
+]
+
+# Maintenance passes closer together than this (e.g. across restarts) are skipped
+_EVENT_MAINTENANCE_MIN_INTERVAL = timedelta(hours=11)
+
+# Max guilds processed concurrently by each startup refresh
+_STARTUP_CONCURRENCY = 5
+
 class GOLBot(commands.Bot):
     """Guild Operations Logistics Discord Bot."""
 
+    # Built once at import; reused for every IDENTIFY
+    _WATCHING_SCHEDULE = discord.Activity(
+        type=discord.ActivityType.watching,
+        name="the schedule 📅"
+    )
+
     def __init__(self):
         intents = discord.Intents.default()
         intents.message_content = True
@@ -25,25 +69,46 @@ class GOLBot(commands.Bot):
         super().__init__(
             command_prefix=Config.BOT_PREFIX,
             intents=intents,
-            help_command=None
+            help_command=None,
+            # Only the configured guild needs a member list; it is chunked
+            # explicitly once ready (and by scan_roster if the cache was reset).
+            chunk_guilds_at_startup=False,
+            # Sent with every IDENTIFY, so no change_presence call is needed after reconnects
+            activity=self._WATCHING_SCHEDULE
         )
 
         self._background_tasks_started = False
         self._on_ready_fired = False  # Guard against multiple on_ready calls
+        self._startup_task: asyncio.Task | None = None
+        self._leave_tasks: set[asyncio.Task] = set()
+        # Messages fetched during startup, shared by the schedule/LOA/roster refreshes
+        self._startup_msg_cache: dict[tuple[int, int], discord.Message] = {}
 
     @tasks.loop(hours=12)
     async def _event_population_maintenance_loop(self):
         try:
+            # The loop fires immediately after every restart; skip if a pass
+            # already completed within the interval.
+            now = datetime.now(timezone.utc)
+            last_run = await bot_state_repository.get_value(EVENT_MAINTENANCE_KEY)
+            if last_run and now - datetime.fromisoformat(last_run) < _EVENT_MAINTENANCE_MIN_INTERVAL:
+                logger.info("Event maintenance ran at %s — skipping", last_run)
+                return
+
             summary = await event_population_service.maintain_event_population()
+            await bot_state_repository.set_value(EVENT_MAINTENANCE_KEY, now.isoformat())
             created = summary.get('created', 0) if isinstance(summary, dict) else 0
             if created:
                 logger.info(
-                    f"Event maintenance populated events: Created={summary.get('created')}, "
-                    f"Skipped={summary.get('skipped')}, Failed={summary.get('failed')}, Total={summary.get('total')}"
+                    "Event maintenance populated events: Created=%s, Skipped=%s, Failed=%s, Total=%s",
+                    summary.get('created'),
+                    summary.get('skipped'),
+                    summary.get('failed'),
+                    summary.get('total')
                 )
                 await self.update_schedule_message_on_startup()
         except Exception as e:
-            logger.warning(f"Event maintenance loop failed: {e}")
+            logger.warning("Event maintenance loop failed: %s", e)
             for guild in self.guilds:
                 if guild.id == Config.GUILD_ID:
                     await report_failure(
@@ -78,9 +143,11 @@ class GOLBot(commands.Bot):
             # Populate initial events
             population_summary = await event_population_service.populate_8_week_range()
             logger.info(
-                f"Event population summary: Created={population_summary['created']}, "
-                f"Skipped={population_summary['skipped']}, Failed={population_summary['failed']}, "
-                f"Total={population_summary['total']}"
+                "Event population summary: Created=%s, Skipped=%s, Failed=%s, Total=%s",
+                population_summary['created'],
+                population_summary['skipped'],
+                population_summary['failed'],
+                population_summary['total']
             )
 
             # Start background maintenance tasks once
@@ -89,43 +156,50 @@ class GOLBot(commands.Bot):
                 self._background_tasks_started = True
                 logger.info("Started background event population maintenance loop")
 
-            # Load command extensions
-            await self.load_extension('commands.schedule_commands')
-            logger.info("Loaded schedule_commands Cog")
-            await self.load_extension('commands.ping_command')
-            logger.info("Loaded ping_command Cog")
-            await self.load_extension('commands.configure_command')
-            logger.info("Commands loaded successfully")
-            await self.load_extension('commands.populate_command')
-            logger.info("Loaded populate_command Cog")
-            await self.load_extension('commands.mission_poll_command')
-            logger.info("Loaded mission_poll_command Cog")
-            await self.load_extension('commands.cancel_poll_command')
-            logger.info("Loaded cancel_poll_command Cog")
-            await self.load_extension('commands.loa_command')
-            logger.info("Loaded loa_command Cog")
-            await self.load_extension('commands.roster_command')
-            logger.info("Loaded roster_command Cog")
-            await self.load_extension('commands.feedback_command')
-            logger.info("Loaded feedback_command Cog")
+            # Load command extensions concurrently — several cogs await the DB in cog_load
+            results = await asyncio.gather(
+                *(self.load_extension(ext) for ext in COMMAND_EXTENSIONS),
+                return_exceptions=True,
+            )
+            failures = []
+            for ext, result in zip(COMMAND_EXTENSIONS, results):
+                if isinstance(result, BaseException):
+                    logger.error("Failed to load %s: %s", ext, result)
+                    failures.append(result)
+                else:
+                    logger.info("Loaded %s Cog", ext)
+            if failures:
+                raise failures[0]
 
             # Print all app commands before syncing
-            logger.info(f"App commands before sync: {[cmd.name for cmd in self.tree.get_commands()]} (total: {len(self.tree.get_commands())})")
+            logger.info("App commands before sync: %s (total: %s)", [cmd.name for cmd in self.tree.get_commands()], len(self.tree.get_commands()))
 
-            # Sync commands to guild - commands should auto-register from the @app_commands.guilds decorators
-            test_guild_id = int(Config.GUILD_ID)
+            # Sync commands to guild - commands should auto-register from the @app_commands.guilds decorators.
+            # tree.sync(guild=...) is a single bulk-overwrite PUT; skip it entirely
+            # when the command payload is unchanged since the last successful sync.
+            test_guild_id = Config.GUILD_ID
             guild_obj = discord.Object(id=test_guild_id)
-            
-            # Clear global commands locally (no API call) to prevent duplicates
-            self.tree.clear_commands(guild=None)
-            logger.info("Cleared global command tree (local only).")
-            
-            # Sync guild commands (single API call)
-            guild_synced = await self.tree.sync(guild=guild_obj)
-            logger.info(f"Synced {len(guild_synced)} commands to guild {test_guild_id}: {[cmd.name for cmd in guild_synced]}")
+
+            payload = [cmd.to_dict(self.tree) for cmd in self.tree.get_commands(guild=guild_obj)]
+            payload_hash = hashlib.sha256(
+                json.dumps(payload, sort_keys=True, default=str).encode()
+            ).hexdigest()
+            hash_key = f"{COMMAND_SYNC_HASH_KEY_PREFIX}{test_guild_id}"
+
+            if await bot_state_repository.get_value(hash_key) == payload_hash:
+                logger.info("Command payload unchanged (%s commands) — skipping guild sync", len(payload))
+            else:
+                guild_synced = await self.tree.sync(guild=guild_obj)
+                await bot_state_repository.set_value(hash_key, payload_hash)
+                logger.info("Synced %s commands to guild %s: %s", len(guild_synced), test_guild_id, [cmd.name for cmd in guild_synced])
+
+            # setup_hook runs exactly once per process, so scheduling the startup
+            # refreshes here keeps them independent of gateway reconnects.
+            if self._startup_task is None:
+                self._startup_task = asyncio.create_task(self._run_startup_refreshes())
 
         except Exception as e:
-            logger.error(f"Error during setup: {e}")
+            logger.error("Error during setup: %s", e)
             for guild in self.guilds:
                 if guild.id == Config.GUILD_ID:
                     await report_failure(
@@ -139,19 +213,32 @@ class GOLBot(commands.Bot):
 
     async def update_schedule_message_on_startup(self):
         from services.schedule_config_repository import schedule_config_repository
-        from services.schedule_embed_service import build_schedule_embed
-        for guild in self.guilds:
-            config = await schedule_config_repository.get_config(guild.id)
-            if config:
+        from services.schedule_embed_cache import refresh_schedule_message
+        from services.message_debouncer import message_debouncer
+
+        sem = asyncio.Semaphore(_STARTUP_CONCURRENCY)
+
+        async def _one(guild):
+            async with sem:
+                config = await schedule_config_repository.get_config(guild.id)
+                if not config:
+                    return
                 channel = guild.get_channel(config["channel_id"])
-                if channel:
-                    try:
-                        msg = await channel.fetch_message(config["message_id"])
-                        embed = await build_schedule_embed(guild)
-                        await msg.edit(embed=embed)
-                        logger.info(f"Updated schedule message for guild {guild.name}")
-                    except Exception as e:
-                        logger.warning(f"Failed to update schedule message for guild {guild.name}: {e}")
+                if not channel:
+                    return
+                msg = self._startup_message(channel, config["message_id"])
+
+                async def _refresh():
+                    async with discord_rate_limiter:
+                        updated = await refresh_schedule_message(guild, msg)
+                    if updated:
+                        logger.info("Updated schedule message for guild %s", guild.name)
+
+                # Startup and maintenance refreshes can land within seconds of
+                # each other — coalesce them into a single edit per message.
+                message_debouncer.schedule((channel.id, msg.id), _refresh)
+
+        await asyncio.gather(*[_one(g) for g in self.guilds], return_exceptions=True)
 
     async def update_loa_message_on_startup(self):
         from services.loa_service import update_summary_message
@@ -162,140 +249,269 @@ class GOLBot(commands.Bot):
         )
         from services.loa_repository import loa_repository
         from services.loa_config_repository import loa_config_repository
-        from datetime import datetime
-
-        for guild in self.guilds:
-            try:
-                # ── Run expiry logic first (catches LOAs that expired while bot was offline) ──
-                now_uk = datetime.now(UK_TZ)
-                today = now_uk.date()
-                is_notification_hours = 8 <= now_uk.hour <= 16
-                summary_needs_update = False
-
-                active_loas = await loa_repository.get_active_loas_by_guild(guild.id)
-                logger.info(f"[LOA STARTUP] Guild {guild.name}: {len(active_loas)} active LOAs found, today={today}")
-
-                for loa_entry in active_loas:
-                    try:
-                        # Ensure date comparison works even if DB returns datetime
-                        end_date = loa_entry["end_date"]
-                        start_date = loa_entry["start_date"]
-                        if hasattr(end_date, 'date'):
-                            end_date = end_date.date()
-                        if hasattr(start_date, 'date'):
-                            start_date = start_date.date()
-
-                        logger.info(
-                            f"[LOA STARTUP] LOA #{loa_entry['id']} user={loa_entry['user_id']} "
-                            f"start={start_date} end={end_date} "
-                            f"expired={loa_entry['expired']} end<today={end_date < today}"
-                        )
-
-                        # Remove @Active for LOAs that have started
-                        if start_date <= today:
-                            await remove_active_role(guild, loa_entry["user_id"])
-
-                        # Expire LOAs whose end date has passed
-                        if end_date < today:
-                            logger.info(f"[LOA STARTUP] Expiring LOA #{loa_entry['id']}")
-                            await loa_repository.mark_expired(loa_entry["id"])
-                            summary_needs_update = True
-
-                            try:
-                                await delete_loa_announcement(guild, loa_entry)
-                            except Exception as e:
-                                logger.warning(f"[LOA STARTUP] Failed to delete announcement for LOA #{loa_entry['id']}: {e}")
-
-                            remaining = await loa_repository.get_active_loas_by_user(
-                                guild.id, loa_entry["user_id"]
-                            )
-                            still_on_leave = any(
-                                (l["start_date"].date() if hasattr(l["start_date"], 'date') else l["start_date"]) <= today
-                                for l in remaining
+        from collections import defaultdict
+
+        sem = asyncio.Semaphore(_STARTUP_CONCURRENCY)
+
+        async def _one(guild):
+            async with sem:
+                try:
+                    # ── Run expiry logic first (catches LOAs that expired while bot was offline) ──
+                    now_uk = datetime.now(UK_TZ)
+                    today = now_uk.date()
+                    is_notification_hours = 8 <= now_uk.hour <= 16
+                    summary_needs_update = False
+
+                    # Group active LOAs per user so remaining-LOA checks are answered
+                    # in memory instead of re-querying the DB per expired LOA
+                    active_loas = await loa_repository.get_active_loas_by_guild(guild.id)
+                    loas_by_user: dict = defaultdict(list)
+                    for loa in active_loas:
+                        loas_by_user[loa["user_id"]].append(loa)
+                    logger.info("[LOA STARTUP] Guild %s: %s active LOAs found, today=%s", guild.name, len(active_loas), today)
+
+                    def _as_date(d):
+                        return d.date() if hasattr(d, 'date') else d
+
+                    # Persist expiry before any Discord side effects, as the
+                    # per-LOA flow used to — a crash or failed write after the
+                    # DMs must not re-send them on the next start.
+                    to_expire_ids: set[int] = {
+                        loa["id"]
+                        for user_loas in loas_by_user.values()
+                        for loa in user_loas
+                        if _as_date(loa["end_date"]) < today
+                    }
+                    await loa_repository.mark_expired_bulk(list(to_expire_ids))
+
+                    expired_so_far: set[int] = set()
+                    to_notify_ids: list[int] = []
+
+                    for loa_entry in (loa for user_loas in loas_by_user.values() for loa in user_loas):
+                        try:
+                            # Ensure date comparison works even if DB returns datetime
+                            end_date = loa_entry["end_date"]
+                            start_date = loa_entry["start_date"]
+                            if hasattr(end_date, 'date'):
+                                end_date = end_date.date()
+                            if hasattr(start_date, 'date'):
+                                start_date = start_date.date()
+
+                            logger.info(
+                                "[LOA STARTUP] LOA #%s user=%s start=%s end=%s expired=%s end<today=%s",
+                                loa_entry['id'],
+                                loa_entry['user_id'],
+                                start_date,
+                                end_date,
+                                loa_entry['expired'],
+                                end_date < today
                             )
 
-                            role_restored = False
-                            if not still_on_leave:
-                                role_restored = await restore_active_role(guild, loa_entry["user_id"])
+                            # Remove @Active for LOAs that have started
+                            if start_date <= today:
+                                await remove_active_role(guild, loa_entry["user_id"])
+
+                            # Expire LOAs whose end date has passed
+                            if loa_entry["id"] in to_expire_ids:
+                                logger.info("[LOA STARTUP] Expiring LOA #%s", loa_entry['id'])
+                                expired_so_far.add(loa_entry["id"])
+                                summary_needs_update = True
 
-                            if is_notification_hours:
                                 try:
-                                    await send_expiry_dm(guild, loa_entry, role_restored=role_restored)
+                                    await delete_loa_announcement(guild, loa_entry)
                                 except Exception as e:
-                                    logger.warning(f"[LOA STARTUP] Failed to send expiry DM for LOA #{loa_entry['id']}: {e}")
-                                await loa_repository.mark_notified(loa_entry["id"])
-                            logger.info(f"[LOA STARTUP] LOA #{loa_entry['id']} expired successfully")
+                                    logger.warning("[LOA STARTUP] Failed to delete announcement for LOA #%s: %s", loa_entry['id'], e)
+
+                                # Remaining active LOAs for this user, excluding any
+                                # already expired earlier in this pass
+                                remaining = [
+                                    l for l in loas_by_user[loa_entry["user_id"]]
+                                    if l["id"] not in expired_so_far
+                                ]
+                                still_on_leave = any(_as_date(l["start_date"]) <= today for l in remaining)
+
+                                role_restored = False
+                                if not still_on_leave:
+                                    role_restored = await restore_active_role(guild, loa_entry["user_id"])
+
+                                if is_notification_hours:
+                                    try:
+                                        await send_expiry_dm(guild, loa_entry, role_restored=role_restored)
+                                    except Exception as e:
+                                        logger.warning("[LOA STARTUP] Failed to send expiry DM for LOA #%s: %s", loa_entry['id'], e)
+                                    to_notify_ids.append(loa_entry["id"])
+                                logger.info("[LOA STARTUP] LOA #%s expired successfully", loa_entry['id'])
+                        except Exception as e:
+                            logger.error("[LOA STARTUP] Error processing LOA #%s: %s", loa_entry.get('id', '?'), e, exc_info=True)
+
+                    # One UPDATE for every DM sent in this pass
+                    try:
+                        await loa_repository.mark_notified_bulk(to_notify_ids)
                     except Exception as e:
-                        logger.error(f"[LOA STARTUP] Error processing LOA #{loa_entry.get('id', '?')}: {e}", exc_info=True)
+                        logger.error("[LOA STARTUP] Failed to mark %s LOAs notified for guild %s: %s", len(to_notify_ids), guild.name, e, exc_info=True)
 
-                if summary_needs_update:
-                    logger.info(f"Expired stale LOAs on startup for guild {guild.name}")
+                    if summary_needs_update:
+                        logger.info("Expired stale LOAs on startup for guild %s", guild.name)
 
-                # ── Rebuild the summary embed ──
-                await update_summary_message(self, guild.id)
-                logger.info(f"Updated LOA summary message for guild {guild.name}")
-            except Exception as e:
-                logger.error(f"Failed to update LOA on startup for guild {guild.name}: {e}", exc_info=True)
+                    # ── Rebuild the summary embed ──
+                    cached_msg = await self._cached_startup_message(guild, loa_config_repository)
+                    async with discord_rate_limiter:
+                        await update_summary_message(self, guild.id, cached_msg)
+                    logger.info("Updated LOA summary message for guild %s", guild.name)
+                except Exception as e:
+                    logger.error("Failed to update LOA on startup for guild %s: %s", guild.name, e, exc_info=True)
+
+        await asyncio.gather(*[_one(g) for g in self.guilds], return_exceptions=True)
 
     async def update_roster_message_on_startup(self):
         from services.roster_service import scan_roster, update_roster_message
-        for guild in self.guilds:
+        from services.roster_config_repository import roster_config_repository
+
+        sem = asyncio.Semaphore(_STARTUP_CONCURRENCY)
+
+        async def _one(guild):
+            async with sem:
+                try:
+                    await scan_roster(guild)
+                    cached_msg = await self._cached_startup_message(guild, roster_config_repository)
+                    async with discord_rate_limiter:
+                        await update_roster_message(self, guild.id, cached_msg)
+                    logger.info("Updated Roster message for guild %s", guild.name)
+                except Exception as e:
+                    logger.warning("Failed to update Roster message for guild %s: %s", guild.name, e)
+
+        await asyncio.gather(*[_one(g) for g in self.guilds], return_exceptions=True)
+
+    # ── Startup message cache ──
+
+    def _startup_message(self, channel, message_id: int) -> discord.PartialMessage:
+        """Return the prefetched message if the startup scan found it, else a partial one.
+
+        Editing only needs the ID, so a miss costs no GET.  Only the startup
+        prefetch fills the cache — the 12h maintenance refresh must not keep
+        reusing a message object fetched hours earlier.
+        """
+        msg = self._startup_msg_cache.get((channel.id, message_id))
+        return msg if msg is not None else channel.get_partial_message(message_id)
+
+    async def _cached_startup_message(self, guild, config_repository) -> discord.Message | None:
+        """Return the prefetched message for a config, or None to let the service fetch it."""
+        config = await config_repository.get_config(guild.id)
+        if not config:
+            return None
+        return self._startup_msg_cache.get((config["channel_id"], config["message_id"]))
+
+    async def _prefetch_startup_messages(self):
+        """Pre-fill the startup cache with one history scan per shared channel.
+
+        When two or more of the schedule/LOA/roster messages live in the same
+        channel, a single ``channel.history(around=...)`` GET replaces one
+        ``fetch_message`` per message.  Anything not found falls back to a
+        ``PartialMessage`` in ``_startup_message``.
+        """
+        from services.schedule_config_repository import schedule_config_repository
+        from services.loa_config_repository import loa_config_repository
+        from services.roster_config_repository import roster_config_repository
+        from collections import defaultdict
+
+        sem = asyncio.Semaphore(_STARTUP_CONCURRENCY)
+
+        async def _one(guild):
+            async with sem:
+                configs = await asyncio.gather(
+                    schedule_config_repository.get_config(guild.id),
+                    loa_config_repository.get_config(guild.id),
+                    roster_config_repository.get_config(guild.id),
+                )
+                ids_by_channel: dict[int, set[int]] = defaultdict(set)
+                for config in configs:
+                    if config and config.get("message_id"):
+                        ids_by_channel[config["channel_id"]].add(config["message_id"])
+
+                for channel_id, message_ids in ids_by_channel.items():
+                    if len(message_ids) < 2:
+                        continue
+                    channel = guild.get_channel(channel_id)
+                    if not channel:
+                        continue
+                    try:
+                        around = discord.Object(id=max(message_ids))
+                        async for msg in channel.history(limit=100, around=around):
+                            if msg.id in message_ids:
+                                self._startup_msg_cache[(channel_id, msg.id)] = msg
+                    except Exception as e:
+                        logger.warning("Startup message prefetch failed for channel %s in guild %s: %s", channel_id, guild.name, e)
+
+        await asyncio.gather(*[_one(g) for g in self.guilds], return_exceptions=True)
+
+    async def _run_startup_refreshes(self):
+        """Refresh the schedule, LOA and roster embeds once the guild cache is ready."""
+        # Guild and channel caches are only populated after the first READY
+        await self.wait_until_ready()
+
+        guild = self.get_guild(Config.GUILD_ID)
+        if guild is not None and not guild.chunked:
             try:
-                await scan_roster(guild)
-                await update_roster_message(self, guild.id)
-                logger.info(f"Updated Roster message for guild {guild.name}")
+                await guild.chunk()
+                logger.info("Chunked %s members for guild %s", guild.member_count, guild.name)
             except Exception as e:
-                logger.warning(f"Failed to update Roster message for guild {guild.name}: {e}")
+                logger.warning("Failed to chunk members for guild %s: %s", guild.name, e)
+
+        await self._prefetch_startup_messages()
+
+        # Run the three startup refreshes concurrently; each bounds its own
+        # per-guild Discord traffic with a semaphore.
+        try:
+            await asyncio.gather(
+                self.update_schedule_message_on_startup(),
+                self.update_loa_message_on_startup(),
+                self.update_roster_message_on_startup(),
+                return_exceptions=True,
+            )
+        finally:
+            # Cached message objects go stale after the edits — drop them
+            self._startup_msg_cache.clear()
 
     async def on_ready(self):
         """Called when the bot is ready (also fires on reconnects)."""
-        logger.info(f'{self.user} has connected to Discord!')
-        logger.info(f'Bot is in {len(self.guilds)} guilds')
-
-        # Guard: only run expensive startup work once, not on every reconnect
         if self._on_ready_fired:
-            logger.info("on_ready fired again (reconnect) — skipping startup API calls")
+            logger.info("on_ready fired again (reconnect) — startup work already scheduled, nothing to do")
             return
         self._on_ready_fired = True
 
-        # Set bot status
-        activity = discord.Activity(
-            type=discord.ActivityType.watching,
-            name="the schedule 📅"
-        )
-        await self.change_presence(activity=activity)
-
-        # Small delay between API calls to avoid burst rate limits
-        await asyncio.sleep(1)
-
-        # Update schedule message on startup
-        await self.update_schedule_message_on_startup()
+        logger.info("%s has connected to Discord!", self.user)
+        logger.info("Bot is in %s guilds", len(self.guilds))
 
-        await asyncio.sleep(1)
-
-        # Update LOA summary message on startup
-        await self.update_loa_message_on_startup()
+    async def on_guild_join(self, guild):
+        """Called when the bot joins a new guild."""
+        # Leave any guild other than the configured one straight away
+        if guild.id != Config.GUILD_ID:
+            task = asyncio.create_task(guild.leave())
+            # Hold a reference so the task isn't garbage-collected mid-flight
+            self._leave_tasks.add(task)
+            task.add_done_callback(self._leave_tasks.discard)
+            logger.warning("Joined unexpected guild %s (ID: %s). Leaving...", guild.name, guild.id)
+            return
 
-        await asyncio.sleep(1)
+        logger.info("Joined guild: %s (ID: %s)", guild.name, guild.id)
 
-        # Update roster message on startup
-        await self.update_roster_message_on_startup()
+    # Role creates/renames/deletes can change which role is @Editor
+    async def on_guild_role_create(self, role: discord.Role):
+        invalidate_editor_role(role.guild.id)
 
-    async def on_guild_join(self, guild):
-        """Called when the bot joins a new guild."""
-        logger.info(f'Joined guild: {guild.name} (ID: {guild.id})')
+    async def on_guild_role_delete(self, role: discord.Role):
+        invalidate_editor_role(role.guild.id)
 
-        # Check if this is the configured guild
-        if guild.id != Config.GUILD_ID:
-            logger.warning(f'Joined unexpected guild {guild.name}. Leaving...')
-            await guild.leave()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        if before.name != after.name:
+            invalidate_editor_role(after.guild.id)
 
     async def on_command_error(self, ctx, error):
         """Handle command errors."""
         if isinstance(error, commands.CommandNotFound):
             return  # Ignore unknown commands
 
-        logger.error(f'Command error: {error}')
+        logger.error("Command error: %s", error)
 
         if ctx.interaction:
             if not ctx.interaction.response.is_done():
@@ -306,7 +522,7 @@ class GOLBot(commands.Bot):
 
     async def on_app_command_error(self, interaction: discord.Interaction, error: discord.app_commands.AppCommandError):
         """Handle application command errors."""
-        logger.error(f'App command error: {error}', exc_info=True)
+        logger.error("App command error: %s", error, exc_info=True)
 
         command_name = "unknown"
         if interaction.command is not None and getattr(interaction.command, "name", None):
@@ -332,11 +548,60 @@ class GOLBot(commands.Bot):
     async def close(self):
         """Clean up when the bot is closing."""
         logger.info("Bot is shutting down...")
+        from services.message_debouncer import message_debouncer
+        message_debouncer.cancel_all()
+        if self._startup_task is not None and not self._startup_task.done():
+            self._startup_task.cancel()
+        from services.raid_helper_service import raid_helper_service
+        await raid_helper_service.close()
         await db_connection.close_pool()
         await super().close()
 
+async def cleanup_commands():
+    """Remove all global and guild slash commands over HTTP only.
+
+    ``login()`` authenticates against the REST API without opening a gateway
+    session, so this costs a handful of requests instead of a full
+    IDENTIFY/READY cycle.  The main bot re-registers commands on next start.
+    """
+    Config.validate_config()
+    client = commands.Bot(command_prefix=Config.BOT_PREFIX, intents=discord.Intents.none())
+
+    try:
+        await client.login(Config.DISCORD_BOT_TOKEN)
+        logger.info("Cleanup logged in as %s", client.user)
+
+        # The client's tree is empty, so each sync is an empty bulk-overwrite PUT
+        global_cleared = await client.tree.sync()
+        logger.info("Cleared global commands (%s remaining)", len(global_cleared))
+        guild_cleared = await client.tree.sync(guild=discord.Object(id=Config.GUILD_ID))
+        logger.info("Cleared commands from guild %s (%s remaining)", Config.GUILD_ID, len(guild_cleared))
+
+        # Forget the last synced payload hash so the main bot re-syncs on next start
+        await bot_state_repository.delete_value(f"{COMMAND_SYNC_HASH_KEY_PREFIX}{Config.GUILD_ID}")
+        logger.info("Command cleanup completed — restart the bot to register commands")
+    finally:
+        await client.close()
+        await db_connection.close_pool()
+
+
 async def main():
     """Main function to run the bot."""
+    # Python 3.12+: run new tasks inline until their first real suspension, so
+    # coroutines that finish on a cache hit skip a pass through the ready queue
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
+    if "--cleanup-commands" in sys.argv[1:]:
+        try:
+            await cleanup_commands()
+        except Exception as e:
+            logger.error("Command cleanup failed: %s", e)
+        finally:
+            _log_listener.stop()
+        return
+
     bot = GOLBot()
 
     try:
@@ -344,9 +609,19 @@ async def main():
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
     except Exception as e:
-        logger.error(f"Bot error: {e}")
+        logger.error("Bot error: %s", e)
     finally:
         await bot.close()
+        # Flush queued log records before the interpreter exits
+        _log_listener.stop()
+
+def run():
+    """Run main() on uvloop when it is installed, else on the default asyncio loop."""
+    if uvloop is not None:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main())
+    else:
+        asyncio.run(main())
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run()
\ No newline at end of file
@@ -1,12 +1,16 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
+import asyncio
 import logging
+from typing import Optional
 
 from config import Config
 from services.mission_poll_repository import mission_poll_repository
 from services.event_repository import event_repository
 from services.mission_poll_service import format_event_date, abbreviate_framework, send_dm_safe, get_log_channel
+from services.permission_service import is_admin_or_editor
+from services.mission_poll_cache import cache_poll_choices, get_cached_poll_choices, invalidate_poll_choices
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +20,7 @@ class CancelPollCommand(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self._background_tasks: set[asyncio.Task] = set()
 
     @app_commands.guilds(Config.GUILD_ID)
     @app_commands.command(
@@ -35,21 +40,22 @@ class CancelPollCommand(commands.Cog):
             )
             return
 
+        # Acknowledge first — the member fetch and DB lookups below can exceed
+        # Discord's 3-second response deadline on a cold pool.
+        await interaction.response.defer(ephemeral=True)
+
         # Permission check: admin or @Editor
         member = interaction.user
         if not isinstance(member, discord.Member):
-            member = await guild.fetch_member(interaction.user.id)
-        is_admin = any(getattr(r.permissions, "administrator", False) for r in member.roles)
-        has_editor = any(r.name.strip().lower() == "editor" for r in member.roles)
-        if not (is_admin or has_editor):
-            await interaction.response.send_message(
+            # Members intent keeps the cache warm; only hit the API on a miss
+            member = guild.get_member(interaction.user.id) or await guild.fetch_member(interaction.user.id)
+        if not is_admin_or_editor(member):
+            await interaction.followup.send(
                 "❌ You must be an admin or have the @Editor role to use this command.",
                 ephemeral=True,
             )
             return
 
-        await interaction.response.defer(ephemeral=True)
-
         # Resolve poll ID
         try:
             poll_id = int(poll)
@@ -67,24 +73,38 @@ class CancelPollCommand(commands.Cog):
             )
             return
 
+        # The DB write and event lookup don't depend on the message deletions
+        mark_task = asyncio.create_task(mission_poll_repository.mark_failed(poll_id))
+        target_event_task = asyncio.create_task(
+            event_repository.get_event_by_id(poll_data["target_event_id"])
+        )
+
         # Delete Discord messages (poll + links embed)
         channel = guild.get_channel(poll_data["channel_id"])
         deleted_msgs = []
         if channel:
-            for msg_id_key in ("poll_message_id", "links_message_id"):
-                msg_id = poll_data.get(msg_id_key)
-                if msg_id:
-                    try:
-                        msg = await channel.fetch_message(msg_id)
-                        await msg.delete()
-                        deleted_msgs.append(msg_id_key)
-                    except discord.NotFound:
-                        pass  # Already deleted
-                    except Exception as e:
-                        logger.warning(f"Failed to delete {msg_id_key} {msg_id}: {e}")
-
-        # Mark as failed in DB
-        await mission_poll_repository.mark_failed(poll_id)
+            async def _delete(msg_id_key: str, msg_id: int) -> Optional[str]:
+                try:
+                    # Deleting only needs the ID — skip the GET round-trip
+                    await channel.get_partial_message(msg_id).delete()
+                    return msg_id_key
+                except discord.NotFound:
+                    return None  # Already deleted
+                except Exception as e:
+                    logger.warning("Failed to delete %s %s: %s", msg_id_key, msg_id, e)
+                    return None
+
+            results = await asyncio.gather(*(
+                _delete(key, poll_data[key])
+                for key in ("poll_message_id", "links_message_id")
+                if poll_data.get(key)
+            ))
+            deleted_msgs = [key for key in results if key]
+
+        # Mark as failed in DB — await both tasks together so neither is
+        # left unretrieved if the other raises
+        _, target_event = await asyncio.gather(mark_task, target_event_task)
+        invalidate_poll_choices(guild.id)
 
         # Remove from the in-memory registry on the poll monitor cog
         poll_cog = self.bot.cogs.get("MissionPollCommands")
@@ -92,7 +112,6 @@ class CancelPollCommand(commands.Cog):
             poll_cog.untrack_poll(poll_id)
 
         # Build confirmation
-        target_event = await event_repository.get_event_by_id(poll_data["target_event_id"])
         event_label = format_event_date(target_event.date) if target_event else f"event #{poll_data['target_event_id']}"
         fw = abbreviate_framework(poll_data.get("framework_filter", ""))
 
@@ -103,13 +122,20 @@ class CancelPollCommand(commands.Cog):
         )
         await interaction.followup.send(confirmation, ephemeral=True)
 
-        # Notify log channel
+        # Notify log channel in the background — the user already has their answer
+        task = asyncio.create_task(self._notify_log_channel(
+            guild,
+            f"🗑️ Poll #{poll_id} for **{event_label}** [{fw}] cancelled by {interaction.user.display_name}.",
+        ))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _notify_log_channel(self, guild: discord.Guild, content: str) -> None:
+        """Best-effort post to the guild's log channel."""
         log_channel = await get_log_channel(guild)
         if log_channel:
             try:
-                await log_channel.send(
-                    f"🗑️ Poll #{poll_id} for **{event_label}** [{fw}] cancelled by {interaction.user.display_name}."
-                )
+                await log_channel.send(content)
             except Exception:
                 pass
 
@@ -122,23 +148,32 @@ class CancelPollCommand(commands.Cog):
             if not guild:
                 return []
 
-            active_polls = await mission_poll_repository.get_active_polls(guild_id=guild.id)
-            choices = []
-            for p in active_polls:
-                target_event = await event_repository.get_event_by_id(p["target_event_id"])
-                if target_event:
-                    event_label = format_event_date(target_event.date)
-                else:
-                    event_label = f"Event #{p['target_event_id']}"
-                fw = abbreviate_framework(p.get("framework_filter", ""))
-                label = f"Poll #{p['id']} — {event_label} [{fw}]"
-
-                if current.lower() in label.lower() or not current:
-                    choices.append(app_commands.Choice(name=label, value=str(p["id"])))
+            labels = get_cached_poll_choices(guild.id)
+            if labels is None:
+                # Polls and their event dates in one round trip — autocomplete
+                # must answer within Discord's 3-second deadline.
+                active_polls = await mission_poll_repository.get_active_polls_with_events(guild.id)
+                labels = []
+                for p in active_polls:
+                    if p["event_date"]:
+                        event_label = format_event_date(p["event_date"])
+                    else:
+                        event_label = f"Event #{p['target_event_id']}"
+                    fw = abbreviate_framework(p.get("framework_filter", ""))
+                    label = f"Poll #{p['id']} — {event_label} [{fw}]"
+                    labels.append((p["id"], label, label.lower()))
+                cache_poll_choices(guild.id, labels)
+
+            current_lower = current.lower()
+            choices = [
+                app_commands.Choice(name=label, value=str(poll_id))
+                for poll_id, label, label_lower in labels
+                if not current or current_lower in label_lower
+            ]
 
             return choices[:25]
         except Exception as e:
-            logger.error(f"Cancel poll autocomplete error: {e}")
+            logger.error("Cancel poll autocomplete error: %s", e)
             return []
 
 
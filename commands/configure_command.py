@@ -1,22 +1,77 @@
-print('[DEBUG] configure_command.py imported')
 import discord
 from discord.ext import commands
 from discord import app_commands
 from typing import Optional
+import asyncio
+import logging
+import time
+from itertools import islice
 from config import Config
 from services.schedule_config_repository import schedule_config_repository
+from services.forum_tag_service import forum_tag_service
+
+logger = logging.getLogger(__name__)
+
+# Text channels per guild for autocomplete, names pre-lowercased:
+# {guild_id: (channel_count, [(channel_id, name_lower, display), ...])}
+_text_channel_index: dict[int, tuple[int, list[tuple[int, str, str]]]] = {}
+
+
+def _text_channel_entries(guild: discord.Guild) -> list[tuple[int, str, str]]:
+    """Return cached ``(channel_id, name_lower, display)`` tuples for the guild's text channels."""
+    channel_count = len(guild.channels)
+    cached = _text_channel_index.get(guild.id)
+    if cached and cached[0] == channel_count:
+        return cached[1]
+    entries = [(c.id, c.name.lower(), f"#{c.name}") for c in guild.text_channels]
+    _text_channel_index[guild.id] = (channel_count, entries)
+    return entries
+
+
+# Forum channels per guild, same shape as _text_channel_index
+_forum_channel_index: dict[int, tuple[int, list[tuple[int, str, str]]]] = {}
+
+
+def _forum_channel_entries(guild: discord.Guild) -> list[tuple[int, str, str]]:
+    """Return cached ``(channel_id, name_lower, display)`` tuples for the guild's forum channels."""
+    channel_count = len(guild.channels)
+    cached = _forum_channel_index.get(guild.id)
+    if cached and cached[0] == channel_count:
+        return cached[1]
+    entries = [(c.id, c.name.lower(), f"# {c.name}") for c in guild.forums]
+    _forum_channel_index[guild.id] = (channel_count, entries)
+    return entries
+
+
+# Oldest messages per channel for the message_id autocomplete:
+# {channel_id: (timestamp, [(message_id, preview), ...])}
+_oldest_msg_cache: dict[int, tuple[float, list[tuple[int, str]]]] = {}
+_OLDEST_MSG_CACHE_TTL = 60  # seconds — the oldest messages in a channel rarely change
+
+
+def _match_entries(
+    entries: list[tuple[int, str, str]], current: str, limit: int = 25
+) -> list[app_commands.Choice[str]]:
+    """Up to *limit* choices whose name contains *current*, stopping at the limit."""
+    q = current.lower()
+    matches = (
+        app_commands.Choice(name=display, value=str(channel_id))
+        for channel_id, name_lower, display in entries
+        if q in name_lower
+    )
+    return list(islice(matches, limit))
+
+
+def _match_text_channels(guild: discord.Guild, current: str) -> list[app_commands.Choice[str]]:
+    """Text-channel choices whose name contains *current* (case-insensitive)."""
+    return _match_entries(_text_channel_entries(guild), current)
+
 
 class ConfigureCommand(commands.Cog):
     # (Test command removed)
     def __init__(self, bot):
         self.bot = bot
-        # Debug: print all app commands registered in this cog after init
-        try:
-            tree = getattr(bot, 'tree', None)
-            if tree:
-                print(f"[DEBUG] Commands in ConfigureCommand: {[cmd.name for cmd in tree.get_commands()]}")
-        except Exception as e:
-            print(f"[DEBUG] Error printing commands in ConfigureCommand: {e}")
+        self._background_tasks: set[asyncio.Task] = set()
 
     # Admin-only command — configures schedule channel, message, briefing forum, and log channel.
     @app_commands.guilds(Config.GUILD_ID)
@@ -35,8 +90,6 @@ class ConfigureCommand(commands.Cog):
         briefing_channel_id: str,
         log_channel_id: str = None
     ):
-        print(f"[DEBUG] configure called with: channel_id={channel_id}, message_id={message_id}, briefing_channel_id={briefing_channel_id}")
-        print(f"[DEBUG] interaction.guild: {getattr(interaction, 'guild', None)}")
         # Restrict to admins only
         if not interaction.user.guild_permissions.administrator:
             await interaction.response.send_message("❌ Only server admins can use this command.", ephemeral=True)
@@ -97,87 +150,90 @@ class ConfigureCommand(commands.Cog):
             log_channel_id_int
         )
 
-        # Populate forum tag cache on configure
+        # Populate forum tag cache on configure — in the background, the
+        # handler doesn't need the result
+        task = asyncio.create_task(self._refresh_forum_tags(interaction.guild, briefing_channel_id_int))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _refresh_forum_tags(self, guild: discord.Guild, forum_channel_id: int) -> None:
+        """Refresh the forum tag cache, logging instead of raising (runs as a background task)."""
         try:
-            from services.forum_tag_service import forum_tag_service
-            await forum_tag_service.refresh_tags(interaction.guild, briefing_channel_id_int)
+            await forum_tag_service.refresh_tags(guild, forum_channel_id)
         except Exception as e:
-            print(f"[DEBUG] Failed to refresh forum tag cache on configure: {e}")
+            logger.warning("Failed to refresh forum tag cache on configure: %s", e)
+
     @configure.autocomplete('channel_id')
     async def channel_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
-        print(f"[DEBUG] channel_autocomplete called with current='{current}', guild={getattr(interaction, 'guild', None)}")
         guild = interaction.guild
         if not guild:
-            print("[DEBUG] channel_autocomplete: No guild found.")
             return []
-        choices = []
-        for channel in guild.text_channels:
-            if current.lower() in channel.name.lower():
-                choices.append(app_commands.Choice(name=f"#{channel.name}", value=str(channel.id)))
-        print(f"[DEBUG] channel_autocomplete: choices={choices}")
-        return choices[:25]
+        return _match_text_channels(guild, current)
 
     @configure.autocomplete('briefing_channel_id')
     async def briefing_channel_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
-        print(f"[DEBUG] briefing_channel_autocomplete called with current='{current}', guild={getattr(interaction, 'guild', None)}")
         guild = interaction.guild
         if not guild:
-            print("[DEBUG] briefing_channel_autocomplete: No guild found.")
             return []
-        choices = []
-        for channel in guild.channels:
-            if channel.type == discord.ChannelType.forum and current.lower() in channel.name.lower():
-                choices.append(app_commands.Choice(name=f"# {channel.name}", value=str(channel.id)))
-        print(f"[DEBUG] briefing_channel_autocomplete: choices={choices}")
-        return choices[:25]
+        return _match_entries(_forum_channel_entries(guild), current)
 
     @configure.autocomplete('log_channel_id')
     async def log_channel_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
         guild = interaction.guild
         if not guild:
             return []
-        choices = []
-        for channel in guild.text_channels:
-            if current.lower() in channel.name.lower():
-                choices.append(app_commands.Choice(name=f"#{channel.name}", value=str(channel.id)))
-        return choices[:25]
+        return _match_text_channels(guild, current)
 
     @configure.autocomplete('message_id')
     async def message_id_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
-        print(f"[DEBUG] message_id_autocomplete called with current='{current}', interaction.namespace={getattr(interaction, 'namespace', None)}")
         channel_id = None
         if hasattr(interaction, 'namespace') and hasattr(interaction.namespace, 'channel_id'):
             channel_id = interaction.namespace.channel_id
-        print(f"[DEBUG] message_id_autocomplete: channel_id from namespace = {channel_id}")
         if not channel_id:
-            print("[DEBUG] message_id_autocomplete: No channel_id found.")
             return [app_commands.Choice(name="Select a channel above first", value="NO_CHANNEL_SELECTED")]
         guild = interaction.guild
         channel = guild.get_channel(int(channel_id)) if guild else None
-        if channel:
-            print(f"[DEBUG] message_id_autocomplete: Found channel: {channel} (id={channel.id})")
-        else:
-            print(f"[DEBUG] message_id_autocomplete: No channel found for channel_id {channel_id}.")
-            return []
-        # Fetch oldest 5 messages (ordered oldest first)
-        messages = []
-        try:
-            async for msg in channel.history(limit=50, oldest_first=True):
-                messages.append(msg)
-                if len(messages) >= 5:
-                    break
-        except Exception as e:
-            print(f"[DEBUG] message_id_autocomplete: Exception: {e}")
+        if not channel:
+            logger.debug("message_id_autocomplete: no channel found for channel_id %s", channel_id)
             return []
-        # Sort messages by created_at (oldest first, though discord.py already does this with oldest_first=True)
-        messages.sort(key=lambda m: m.created_at)
+        # Oldest 5 messages (ordered oldest first), reused across keystrokes
+        cached = _oldest_msg_cache.get(channel.id)
+        if cached and time.monotonic() - cached[0] < _OLDEST_MSG_CACHE_TTL:
+            previews = cached[1]
+        else:
+            try:
+                previews = [
+                    (msg.id, (msg.content[:30] + "...") if len(msg.content) > 30 else msg.content)
+                    async for msg in channel.history(limit=5, oldest_first=True)
+                ]
+            except Exception as e:
+                logger.debug("message_id_autocomplete: history fetch failed: %s", e)
+                return []
+            _oldest_msg_cache[channel.id] = (time.monotonic(), previews)
         choices = [app_commands.Choice(name="➕ Create new schedule message", value="CREATE_NEW")]
-        for msg in messages:
-            preview = (msg.content[:30] + "...") if len(msg.content) > 30 else msg.content
-            choices.append(app_commands.Choice(name=f"{msg.id}: {preview}", value=str(msg.id)))
-        print(f"[DEBUG] message_id_autocomplete: choices={choices}")
+        for msg_id, preview in previews:
+            choices.append(app_commands.Choice(name=f"{msg_id}: {preview}", value=str(msg_id)))
         return choices[:25]
 
+    # ─── Channel index invalidation ─────────────────────────────────────
+    # Creates/deletes also change the channel count, but renames and moves
+    # do not — drop the guild's cached indexes on any channel change.
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel):
+        _text_channel_index.pop(channel.guild.id, None)
+        _forum_channel_index.pop(channel.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        _text_channel_index.pop(channel.guild.id, None)
+        _forum_channel_index.pop(channel.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before, after):
+        _text_channel_index.pop(after.guild.id, None)
+        _forum_channel_index.pop(after.guild.id, None)
+
     # ─── /configureevents — Admin-only events channel configure ─────────
     @app_commands.guilds(Config.GUILD_ID)
     @app_commands.command(
@@ -243,16 +299,9 @@ class ConfigureCommand(commands.Cog):
         guild = interaction.guild
         if not guild:
             return []
-        choices = []
-        for channel in guild.text_channels:
-            if current.lower() in channel.name.lower():
-                choices.append(
-                    app_commands.Choice(name=f"#{channel.name}", value=str(channel.id))
-                )
-        return choices[:25]
+        return _match_text_channels(guild, current)
 
 
 async def setup(bot):
-    print('[DEBUG] setup() called in configure_command.py')
     cog = ConfigureCommand(bot)
     await bot.add_cog(cog)
@@ -15,6 +15,7 @@ from services.log_channel_service import report_failure
 from services.schedule_config_repository import schedule_config_repository
 from services.raid_helper_service import raid_helper_service
 from services.schedule_embed_service import find_briefing_post_link
+from services.permission_service import is_admin_or_editor
 
 logger = logging.getLogger(__name__)
 
@@ -96,13 +97,9 @@ class FeedbackCommands(commands.Cog):
 
         member = interaction.user
         if not isinstance(member, discord.Member):
-            member = await guild.fetch_member(interaction.user.id)
+            member = guild.get_member(interaction.user.id) or await guild.fetch_member(interaction.user.id)
 
-        is_admin = any(
-            getattr(r.permissions, "administrator", False) for r in member.roles
-        )
-        has_editor = any(r.name.strip().lower() == "editor" for r in member.roles)
-        if not (is_admin or has_editor):
+        if not is_admin_or_editor(member):
             await interaction.response.send_message(
                 "❌ You must be an admin or have the @Editor role to use this command.",
                 ephemeral=True,
@@ -299,13 +296,9 @@ class FeedbackCommands(commands.Cog):
         # Permission check: admin or @Editor
         member = interaction.user
         if not isinstance(member, discord.Member):
-            member = await guild.fetch_member(interaction.user.id)
+            member = guild.get_member(interaction.user.id) or await guild.fetch_member(interaction.user.id)
 
-        is_admin = any(
-            getattr(r.permissions, "administrator", False) for r in member.roles
-        )
-        has_editor = any(r.name.strip().lower() == "editor" for r in member.roles)
-        if not (is_admin or has_editor):
+        if not is_admin_or_editor(member):
             await interaction.response.send_message(
                 "❌ You must be an admin or have the @Editor role to use this command.",
                 ephemeral=True,
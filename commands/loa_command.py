@@ -4,7 +4,12 @@ from discord import app_commands
 from typing import Optional
 from datetime import datetime, date
 from zoneinfo import ZoneInfo
+import asyncio
+import functools
 import logging
+import re
+import time
+from collections import Counter, defaultdict
 
 from config import Config
 from services.loa_repository import loa_repository
@@ -15,9 +20,11 @@ from services.loa_service import (
     UK_TZ,
     build_loa_announcement_embed,
     build_loa_summary_embed,
-    update_summary_message,
-    remove_active_role,
-    restore_active_role,
+    format_loa_date,
+    schedule_summary_update,
+    apply_role_delta,
+    get_or_fetch_member,
+    resolve_members,
     send_expiry_dm,
     delete_loa_announcement,
 )
@@ -28,14 +35,63 @@ logger = logging.getLogger(__name__)
 
 # ── Helpers ────────────────────────────────────────────────────────────
 
+_DATE_RE = re.compile(r"(\d{1,2})-(\d{1,2})-(\d{4})")
+
 def _parse_date(value: str) -> Optional[date]:
     """Parse a date string in DD-MM-YYYY format."""
+    # Malformed input is rejected by the regex without raising; only
+    # out-of-range values (e.g. 31-02) reach the ValueError path.
+    m = _DATE_RE.fullmatch(value.strip())
+    if not m:
+        return None
     try:
-        return datetime.strptime(value.strip(), "%d-%m-%Y").date()
+        return date(int(m[3]), int(m[2]), int(m[1]))
     except ValueError:
         return None
 
 
+def _loa_choices(active_loas: list[dict], current: str) -> list[app_commands.Choice[int]]:
+    """Autocomplete choices for a user's LOAs, filtered by *current*."""
+    needle = current.lower()
+    choices: list[app_commands.Choice[int]] = []
+    for entry in active_loas:
+        start_str = format_loa_date(entry["start_date"])
+        end_str = format_loa_date(entry["end_date"])
+        label = f"{start_str} → {end_str}"
+        if entry.get("reason"):
+            label += f": {entry['reason']}"
+        label = label[:100]  # Discord max 100 chars
+
+        if needle and needle not in label.lower():
+            continue
+        choices.append(app_commands.Choice(name=label, value=entry["id"]))
+        if len(choices) == 25:  # Discord max 25 choices
+            break
+    return choices
+
+
+def _deferred(func):
+    """Defer the interaction (ephemeral) before running the command, and log timings.
+
+    Deferring first keeps slow paths (cold DB pool, many Discord calls)
+    inside the 15-minute followup window instead of the 3-second one.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, interaction: discord.Interaction, *args, **kwargs):
+        start = time.perf_counter()
+        await interaction.response.defer(ephemeral=True)
+        deferred = time.perf_counter()
+        try:
+            return await func(self, interaction, *args, **kwargs)
+        finally:
+            end = time.perf_counter()
+            logger.info(
+                f"⏱ /{interaction.command.name if interaction.command else func.__name__} "
+                f"defer={(deferred - start) * 1000:.0f}ms total={(end - start) * 1000:.0f}ms"
+            )
+    return wrapper
+
+
 # ── Cog ────────────────────────────────────────────────────────────────
 
 class LOACommands(commands.Cog):
@@ -63,6 +119,7 @@ class LOACommands(commands.Cog):
         reason="Optional reason for your leave",
     )
     @app_commands.guilds(discord.Object(id=Config.GUILD_ID))
+    @_deferred
     async def loa_command(
         self,
         interaction: discord.Interaction,
@@ -70,8 +127,6 @@ class LOACommands(commands.Cog):
         end_date: str,
         reason: Optional[str] = None,
     ):
-        await interaction.response.defer(ephemeral=True)
-
         # ── Permission check: @Member role required ──
         member_role = interaction.guild.get_role(MEMBER_ROLE_ID)
         if not member_role or member_role not in interaction.user.roles:
@@ -121,8 +176,8 @@ class LOACommands(commands.Cog):
             interaction.guild_id, interaction.user.id, parsed_start, parsed_end
         )
         if overlap:
-            o_start = overlap["start_date"].strftime("%d-%m-%Y")
-            o_end = overlap["end_date"].strftime("%d-%m-%Y")
+            o_start = format_loa_date(overlap["start_date"])
+            o_end = format_loa_date(overlap["end_date"])
             await interaction.followup.send(
                 f"❌ This LOA overlaps with your existing leave: "
                 f"**{o_start} → {o_end}**.\n"
@@ -141,16 +196,9 @@ class LOACommands(commands.Cog):
             )
             return
 
-        # ── Create DB record ──
-        loa = await loa_repository.create_loa(
-            interaction.guild_id,
-            interaction.user.id,
-            parsed_start,
-            parsed_end,
-            reason,
-        )
-
         # ── Post announcement embed ──
+        # Sent before the insert so the row is written once, message info included
+        announcement_msg = None
         loa_channel = interaction.guild.get_channel(config["channel_id"])
         if loa_channel:
             embed = build_loa_announcement_embed(
@@ -160,22 +208,44 @@ class LOACommands(commands.Cog):
                 content=interaction.user.mention,
                 embed=embed,
             )
-            await loa_repository.update_message_info(
-                loa["id"], announcement_msg.id, loa_channel.id
+
+        # ── Create DB record ──
+        try:
+            await loa_repository.create_loa(
+                interaction.guild_id,
+                interaction.user.id,
+                parsed_start,
+                parsed_end,
+                reason,
+                message_id=announcement_msg.id if announcement_msg else None,
+                channel_id=loa_channel.id if announcement_msg else None,
             )
+        except Exception:
+            # Don't leave an announcement for an LOA that was never recorded
+            if announcement_msg:
+                try:
+                    await announcement_msg.delete()
+                except discord.HTTPException:
+                    pass
+            raise
 
         # ── Remove @Active role if LOA starts today ──
         if parsed_start <= today:
-            await remove_active_role(interaction.guild, interaction.user.id)
+            await apply_role_delta(
+                interaction.guild,
+                interaction.user.id,
+                remove=frozenset({ACTIVE_ROLE_ID}),
+                reason="Leave of Absence started",
+            )
 
         # ── Update summary message ──
-        await update_summary_message(self.bot, interaction.guild_id)
+        schedule_summary_update(self.bot, interaction.guild_id)
 
         # ── Ephemeral confirmation ──
         confirm = (
             f"✅ Your Leave of Absence has been registered!\n"
-            f"📅 **{parsed_start.strftime('%d-%m-%Y')}** → "
-            f"**{parsed_end.strftime('%d-%m-%Y')}**"
+            f"📅 **{format_loa_date(parsed_start)}** → "
+            f"**{format_loa_date(parsed_end)}**"
         )
         if reason:
             confirm += f"\n💬 {reason}"
@@ -191,13 +261,12 @@ class LOACommands(commands.Cog):
         loa="Select the leave of absence to cancel",
     )
     @app_commands.guilds(discord.Object(id=Config.GUILD_ID))
+    @_deferred
     async def cancel_loa_command(
         self,
         interaction: discord.Interaction,
         loa: int,
     ):
-        await interaction.response.defer(ephemeral=True)
-
         # ── Fetch & validate ──
         loa_record = await loa_repository.get_loa_by_id(loa)
 
@@ -223,8 +292,7 @@ class LOACommands(commands.Cog):
         today = datetime.now(UK_TZ).date()
 
         # ── Mark expired (no DM needed for cancellation) ──
-        await loa_repository.mark_expired(loa_record["id"])
-        await loa_repository.mark_notified(loa_record["id"])
+        await loa_repository.mark_cancelled(loa_record["id"])
 
         # ── Restore @Active only if the LOA had actually started
         #    AND the user has no other currently-active LOA ──
@@ -234,16 +302,22 @@ class LOACommands(commands.Cog):
             )
             still_on_leave = any(l["start_date"] <= today for l in remaining)
             if not still_on_leave:
-                await restore_active_role(interaction.guild, interaction.user.id)
+                await apply_role_delta(
+                    interaction.guild,
+                    interaction.user.id,
+                    add=frozenset({ACTIVE_ROLE_ID}),
+                    requires_role_id=MEMBER_ROLE_ID,
+                    reason="Leave of Absence cancelled",
+                )
 
         # ── Delete announcement embed ──
         await delete_loa_announcement(interaction.guild, loa_record)
 
         # ── Update summary ──
-        await update_summary_message(self.bot, interaction.guild_id)
+        schedule_summary_update(self.bot, interaction.guild_id)
 
-        start_str = loa_record["start_date"].strftime("%d-%m-%Y")
-        end_str = loa_record["end_date"].strftime("%d-%m-%Y")
+        start_str = format_loa_date(loa_record["start_date"])
+        end_str = format_loa_date(loa_record["end_date"])
         await interaction.followup.send(
             f"✅ Your leave of absence (`{start_str}` → `{end_str}`) "
             "has been cancelled.\nWelcome back to duty! 💪",
@@ -266,19 +340,7 @@ class LOACommands(commands.Cog):
             )
             logger.info(f"[cancelloa autocomplete] found {len(active_loas)} active LOAs")
 
-            choices: list[app_commands.Choice[int]] = []
-            for entry in active_loas:
-                start_str = entry["start_date"].strftime("%d-%m-%Y")
-                end_str = entry["end_date"].strftime("%d-%m-%Y")
-                label = f"{start_str} → {end_str}"
-                if entry.get("reason"):
-                    label += f": {entry['reason']}"
-                label = label[:100]  # Discord max 100 chars
-
-                if not current or current.lower() in label.lower():
-                    choices.append(app_commands.Choice(name=label, value=entry["id"]))
-
-            return choices[:25]  # Discord max 25 choices
+            return _loa_choices(active_loas, current)
         except Exception as e:
             logger.error(f"[cancelloa autocomplete] error: {e}", exc_info=True)
             return []
@@ -294,14 +356,13 @@ class LOACommands(commands.Cog):
         loa="Select the leave of absence to cancel",
     )
     @app_commands.guilds(discord.Object(id=Config.GUILD_ID))
+    @_deferred
     async def admin_cancel_loa_command(
         self,
         interaction: discord.Interaction,
         user: discord.Member,
         loa: int,
     ):
-        await interaction.response.defer(ephemeral=True)
-
         # ── Permission check: administrator or moderate_members ──
         perms = interaction.user.guild_permissions
         if not (perms.administrator or perms.moderate_members):
@@ -337,8 +398,7 @@ class LOACommands(commands.Cog):
         today = datetime.now(UK_TZ).date()
 
         # ── Mark expired (no DM needed for cancellation) ──
-        await loa_repository.mark_expired(loa_record["id"])
-        await loa_repository.mark_notified(loa_record["id"])
+        await loa_repository.mark_cancelled(loa_record["id"])
 
         # ── Restore @Active only if the LOA had actually started
         #    AND the user has no other currently-active LOA ──
@@ -348,16 +408,22 @@ class LOACommands(commands.Cog):
             )
             still_on_leave = any(l["start_date"] <= today for l in remaining)
             if not still_on_leave:
-                await restore_active_role(interaction.guild, user.id)
+                await apply_role_delta(
+                    interaction.guild,
+                    user.id,
+                    add=frozenset({ACTIVE_ROLE_ID}),
+                    requires_role_id=MEMBER_ROLE_ID,
+                    reason="Leave of Absence cancelled",
+                )
 
         # ── Delete announcement embed ──
         await delete_loa_announcement(interaction.guild, loa_record)
 
         # ── Update summary ──
-        await update_summary_message(self.bot, interaction.guild_id)
+        schedule_summary_update(self.bot, interaction.guild_id)
 
-        start_str = loa_record["start_date"].strftime("%d-%m-%Y")
-        end_str = loa_record["end_date"].strftime("%d-%m-%Y")
+        start_str = format_loa_date(loa_record["start_date"])
+        end_str = format_loa_date(loa_record["end_date"])
         await interaction.followup.send(
             f"✅ Leave of absence for {user.mention} "
             f"(`{start_str}` → `{end_str}`) has been cancelled.",
@@ -404,19 +470,7 @@ class LOACommands(commands.Cog):
             )
             logger.info(f"[admincancelloa autocomplete] found {len(active_loas)} active LOAs")
 
-            choices: list[app_commands.Choice[int]] = []
-            for entry in active_loas:
-                start_str = entry["start_date"].strftime("%d-%m-%Y")
-                end_str = entry["end_date"].strftime("%d-%m-%Y")
-                label = f"{start_str} → {end_str}"
-                if entry.get("reason"):
-                    label += f": {entry['reason']}"
-                label = label[:100]  # Discord max 100 chars
-
-                if not current or current.lower() in label.lower():
-                    choices.append(app_commands.Choice(name=label, value=entry["id"]))
-
-            return choices[:25]  # Discord max 25 choices
+            return _loa_choices(active_loas, current)
         except Exception as e:
             logger.error(f"[admincancelloa autocomplete] error: {e}", exc_info=True)
             return []
@@ -430,12 +484,12 @@ class LOACommands(commands.Cog):
     @app_commands.describe(channel="The channel to use for Leave of Absence posts")
     @app_commands.guilds(discord.Object(id=Config.GUILD_ID))
     @app_commands.checks.has_permissions(administrator=True)
+    @_deferred
     async def configure_loa_command(
         self,
         interaction: discord.Interaction,
         channel: discord.TextChannel,
     ):
-        await interaction.response.defer(ephemeral=True)
         guild_id = interaction.guild_id
 
         # ── Clean up old config if it exists ──
@@ -445,15 +499,19 @@ class LOACommands(commands.Cog):
             if old_channel:
                 # Delete old summary message
                 try:
-                    old_msg = await old_channel.fetch_message(old_config["message_id"])
-                    await old_msg.delete()
+                    await old_channel.get_partial_message(old_config["message_id"]).delete()
                 except (discord.NotFound, discord.HTTPException):
                     pass
 
                 # Delete all active LOA announcement embeds from old channel
                 active_loas = await loa_repository.get_active_loas_by_guild(guild_id)
-                for loa_entry in active_loas:
-                    await delete_loa_announcement(interaction.guild, loa_entry)
+                delete_sem = asyncio.Semaphore(5)
+
+                async def _delete(loa_entry: dict) -> None:
+                    async with delete_sem:
+                        await delete_loa_announcement(interaction.guild, loa_entry)
+
+                await asyncio.gather(*(_delete(e) for e in active_loas))
 
         # ── Post new summary message ──
         active_loas = await loa_repository.get_active_loas_by_guild(guild_id)
@@ -464,26 +522,43 @@ class LOACommands(commands.Cog):
         await loa_config_repository.set_config(guild_id, channel.id, summary_msg.id)
 
         # ── Re-post announcement embeds for all active LOAs ──
-        for loa_entry in active_loas:
-            try:
-                member = await interaction.guild.fetch_member(loa_entry["user_id"])
-                embed = build_loa_announcement_embed(
-                    member,
-                    loa_entry["start_date"],
-                    loa_entry["end_date"],
-                    loa_entry.get("reason"),
-                )
-                ann_msg = await channel.send(
-                    content=f"<@{loa_entry['user_id']}>", embed=embed
-                )
-                await loa_repository.update_message_info(
-                    loa_entry["id"], ann_msg.id, channel.id
-                )
-            except (discord.NotFound, discord.HTTPException) as e:
-                logger.warning(
-                    f"Failed to re-post LOA announcement for user "
-                    f"{loa_entry['user_id']}: {e}"
-                )
+        # Bounded fan-out: overlaps the sends without bursting past the
+        # channel rate limit (posting order is not guaranteed).
+        sem = asyncio.Semaphore(5)
+        members = await resolve_members(
+            interaction.guild, [e["user_id"] for e in active_loas]
+        )
+
+        async def _repost(loa_entry: dict) -> Optional[tuple[int, int, int]]:
+            async with sem:
+                member = members.get(loa_entry["user_id"])
+                if member is None:
+                    logger.warning(
+                        f"Failed to re-post LOA announcement for user "
+                        f"{loa_entry['user_id']}: member not found"
+                    )
+                    return None
+                try:
+                    embed = build_loa_announcement_embed(
+                        member,
+                        loa_entry["start_date"],
+                        loa_entry["end_date"],
+                        loa_entry.get("reason"),
+                    )
+                    ann_msg = await channel.send(
+                        content=f"<@{loa_entry['user_id']}>", embed=embed
+                    )
+                    return (loa_entry["id"], ann_msg.id, channel.id)
+                except (discord.NotFound, discord.HTTPException) as e:
+                    logger.warning(
+                        f"Failed to re-post LOA announcement for user "
+                        f"{loa_entry['user_id']}: {e}"
+                    )
+                    return None
+
+        results = await asyncio.gather(*(_repost(e) for e in active_loas))
+        message_rows = [row for row in results if row]
+        await loa_repository.update_message_info_bulk(message_rows)
 
         await interaction.followup.send(
             f"✅ LOA system configured! Summary message posted in {channel.mention}.",
@@ -496,160 +571,219 @@ class LOACommands(commands.Cog):
     async def _loa_check_loop(self):
         """Hourly check: expire LOAs, manage roles, send DMs during UK daytime."""
         try:
-            from collections import defaultdict
             now_uk = datetime.now(UK_TZ)
             today = now_uk.date()
             is_notification_hours = 8 <= now_uk.hour <= 16
 
+            # Guilds are independent — one slow guild shouldn't stall the rest
+            await asyncio.gather(
+                *(self._process_guild(g, today, is_notification_hours) for g in self.bot.guilds),
+                return_exceptions=True,
+            )
+        except Exception as e:
+            logger.error(f"LOA check loop error: {e}", exc_info=True)
             for guild in self.bot.guilds:
-                guild_id = guild.id
-                summary_needs_update = False
+                if guild.id == Config.GUILD_ID:
+                    await report_failure(
+                        guild,
+                        "LOA Loop",
+                        "Hourly LOA check loop crashed.",
+                        e,
+                    )
+                    break
 
-                active_loas = await loa_repository.get_active_loas_by_guild(guild_id)
-                logger.info(f"[LOA LOOP] Guild {guild.name}: {len(active_loas)} active LOAs, today={today}")
+    async def _process_guild(
+        self,
+        guild: discord.Guild,
+        today: date,
+        is_notification_hours: bool,
+    ) -> None:
+        """Run one guild's LOA check.  Errors are reported, never raised."""
+        guild_id = guild.id
+        active_role = guild.get_role(ACTIVE_ROLE_ID)
+        # Members resolved this tick — cache first, API only on a miss
+        members: dict[int, Optional[discord.Member]] = {}
+
+        async def _member(user_id: int) -> Optional[discord.Member]:
+            if user_id not in members:
+                members[user_id] = await get_or_fetch_member(guild, user_id)
+            return members[user_id]
 
-                # Group by user_id so we can check remaining LOAs in memory
-                # instead of re-querying the DB per expired LOA.
-                loas_by_user: dict = defaultdict(list)
-                for loa in active_loas:
-                    loas_by_user[loa["user_id"]].append(loa)
+        try:
+            summary_needs_update = False
+
+            # Planned (future) LOAs need no action this tick — filter them in SQL
+            active_loas = await loa_repository.get_started_or_ended_loas_by_guild(guild_id, today)
+            logger.info(f"[LOA LOOP] Guild {guild.name}: {len(active_loas)} started/ended LOAs, today={today}")
+
+            # Started (non-expired) LOAs per user, decremented as they expire
+            # below — "still on leave" is then a lookup, not a rescan.
+            started_count: Counter[int] = Counter(
+                loa["user_id"]
+                for loa in active_loas
+                if (loa["start_date"].date() if hasattr(loa["start_date"], 'date') else loa["start_date"]) <= today
+            )
 
-                to_expire_ids: set[int] = set()
-                to_notify_ids: list[int] = []
+            to_expire_ids: set[int] = set()
+            to_notify_ids: list[int] = []
+            expired_entries: list = []
+            # Net role changes per user for this tick: {user_id: (adds, removes)}.
+            # A later add cancels an earlier remove of the same role, so a
+            # user whose LOA starts and ends within one tick gets one edit.
+            pending: dict[int, tuple[set[int], set[int]]] = defaultdict(lambda: (set(), set()))
 
-                for loa_entry in active_loas:
-                    try:
-                        # Ensure date comparison works even if DB returns datetime
-                        end_date = loa_entry["end_date"]
-                        start_date = loa_entry["start_date"]
-                        if hasattr(end_date, 'date'):
-                            end_date = end_date.date()
-                        if hasattr(start_date, 'date'):
-                            start_date = start_date.date()
-
-                        # 1. Remove @Active for LOAs that have started
-                        if start_date <= today:
-                            await remove_active_role(guild, loa_entry["user_id"])
-                            # Planned → Active transition: embed must reflect new category
-                            if start_date == today:
-                                summary_needs_update = True
-
-                        # 2. Expire LOAs whose end date has passed
-                        if end_date < today:
-                            logger.info(
-                                f"[LOA LOOP] Expiring LOA #{loa_entry['id']} "
-                                f"user={loa_entry['user_id']} end={end_date}"
-                            )
-                            to_expire_ids.add(loa_entry["id"])
+            for loa_entry in active_loas:
+                try:
+                    # Ensure date comparison works even if DB returns datetime
+                    end_date = loa_entry["end_date"]
+                    start_date = loa_entry["start_date"]
+                    if hasattr(end_date, 'date'):
+                        end_date = end_date.date()
+                    if hasattr(start_date, 'date'):
+                        start_date = start_date.date()
+
+                    # 1. Remove @Active for LOAs that have started
+                    if start_date <= today:
+                        adds, removes = pending[loa_entry["user_id"]]
+                        removes.add(ACTIVE_ROLE_ID)
+                        adds.discard(ACTIVE_ROLE_ID)
+                        # Planned → Active transition: embed must reflect new category
+                        if start_date == today:
                             summary_needs_update = True
 
-                            # Delete announcement embed
-                            try:
-                                await delete_loa_announcement(guild, loa_entry)
-                            except Exception as e:
-                                logger.warning(f"[LOA LOOP] Failed to delete announcement for LOA #{loa_entry['id']}: {e}")
-                                await report_failure(
-                                    guild,
-                                    "LOA Loop",
-                                    f"Failed to delete announcement for LOA #{loa_entry['id']}.",
-                                    e,
-                                )
-
-                            # In-memory check: remaining active LOAs for this user
-                            # (excluding any we've already decided to expire this run)
-                            remaining = [
-                                l for l in loas_by_user[loa_entry["user_id"]]
-                                if l["id"] not in to_expire_ids
-                            ]
-                            still_on_leave = any(
-                                (l["start_date"].date() if hasattr(l["start_date"], 'date') else l["start_date"]) <= today
-                                for l in remaining
-                            )
-
-                            role_restored = False
-                            if not still_on_leave:
-                                role_restored = await restore_active_role(
-                                    guild, loa_entry["user_id"]
-                                )
-
-                            # DM notification — only during UK 08:00-16:00
-                            if is_notification_hours:
-                                try:
-                                    await send_expiry_dm(
-                                        guild, loa_entry, role_restored=role_restored
-                                    )
-                                except Exception as e:
-                                    logger.warning(f"[LOA LOOP] Failed to send expiry DM for LOA #{loa_entry['id']}: {e}")
-                                    await report_failure(
-                                        guild,
-                                        "LOA Loop",
-                                        f"Failed to send expiry DM for LOA #{loa_entry['id']}.",
-                                        e,
-                                    )
-                                to_notify_ids.append(loa_entry["id"])
-                            else:
-                                # If user left the server, mark notified anyway
-                                try:
-                                    await guild.fetch_member(loa_entry["user_id"])
-                                except (discord.NotFound, discord.HTTPException):
-                                    to_notify_ids.append(loa_entry["id"])
-                    except Exception as e:
-                        logger.error(f"[LOA LOOP] Error processing LOA #{loa_entry.get('id', '?')}: {e}", exc_info=True)
-                        await report_failure(
-                            guild,
-                            "LOA Loop",
-                            f"Error while processing LOA #{loa_entry.get('id', '?')}.",
-                            e,
+                    # 2. Expire LOAs whose end date has passed
+                    if end_date < today:
+                        logger.info(
+                            f"[LOA LOOP] Expiring LOA #{loa_entry['id']} "
+                            f"user={loa_entry['user_id']} end={end_date}"
                         )
+                        to_expire_ids.add(loa_entry["id"])
+                        expired_entries.append(loa_entry)
+                        summary_needs_update = True
 
-                # Bulk DB writes — replace N individual round-trips with 2 queries
-                await loa_repository.mark_expired_bulk(list(to_expire_ids))
-                await loa_repository.mark_notified_bulk(to_notify_ids)
-
-                # 3. Send pending DM notifications for previously expired LOAs
-                if is_notification_hours:
-                    unnotified = await loa_repository.get_expired_unnotified(guild_id)
-                    unnotified_to_mark: list[int] = []
-                    for loa_entry in unnotified:
+                        # Delete announcement embed
                         try:
-                            member = await guild.fetch_member(loa_entry["user_id"])
-                            active_role = guild.get_role(ACTIVE_ROLE_ID)
-                            has_active = (
-                                active_role in member.roles if active_role else False
-                            )
-                        except (discord.NotFound, discord.HTTPException):
-                            has_active = False
-
-                        try:
-                            await send_expiry_dm(
-                                guild, loa_entry, role_restored=has_active
-                            )
+                            await delete_loa_announcement(guild, loa_entry)
                         except Exception as e:
-                            logger.warning(f"[LOA LOOP] Failed to send expiry DM for unnotified LOA #{loa_entry['id']}: {e}")
+                            logger.warning(f"[LOA LOOP] Failed to delete announcement for LOA #{loa_entry['id']}: {e}")
                             await report_failure(
                                 guild,
                                 "LOA Loop",
-                                f"Failed to send expiry DM for unnotified LOA #{loa_entry['id']}.",
+                                f"Failed to delete announcement for LOA #{loa_entry['id']}.",
                                 e,
                             )
-                        unnotified_to_mark.append(loa_entry["id"])
-                    await loa_repository.mark_notified_bulk(unnotified_to_mark)
-
-                # 4. Update summary if anything changed
-                if summary_needs_update:
-                    await update_summary_message(self.bot, guild_id)
 
-        except Exception as e:
-            logger.error(f"LOA check loop error: {e}", exc_info=True)
-            for guild in self.bot.guilds:
-                if guild.id == Config.GUILD_ID:
+                        # In-memory check: does the user have another started
+                        # LOA that isn't being expired in this run?
+                        if start_date <= today:
+                            started_count[loa_entry["user_id"]] -= 1
+                        still_on_leave = started_count[loa_entry["user_id"]] > 0
+
+                        if not still_on_leave:
+                            adds, removes = pending[loa_entry["user_id"]]
+                            adds.add(ACTIVE_ROLE_ID)
+                            removes.discard(ACTIVE_ROLE_ID)
+                except Exception as e:
+                    logger.error(f"[LOA LOOP] Error processing LOA #{loa_entry.get('id', '?')}: {e}", exc_info=True)
                     await report_failure(
                         guild,
                         "LOA Loop",
-                        "Hourly LOA check loop crashed.",
+                        f"Error while processing LOA #{loa_entry.get('id', '?')}.",
                         e,
                     )
-                    break
+
+            # Flush role changes — one Modify Guild Member call per user.
+            # Members are resolved through _member() so the DM and
+            # left-server checks below reuse the same lookup.
+            async def _flush(user_id: int) -> Optional[set[int]]:
+                member = await _member(user_id)
+                if member is None:
+                    return None
+                return await apply_role_delta(
+                    guild,
+                    user_id,
+                    add=frozenset(pending[user_id][0]),
+                    remove=frozenset(pending[user_id][1]),
+                    requires_role_id=MEMBER_ROLE_ID,
+                    reason="Leave of Absence update",
+                    member=member,
+                )
+
+            user_ids = list(pending)
+            results = await asyncio.gather(*(_flush(user_id) for user_id in user_ids))
+            # Role IDs actually added per user (None = member missing or edit failed)
+            added_roles = dict(zip(user_ids, results))
+
+            for loa_entry in expired_entries:
+                user_id = loa_entry["user_id"]
+                added = added_roles.get(user_id)
+                role_restored = added is not None and ACTIVE_ROLE_ID in added
+
+                # DM notification — only during UK 08:00-16:00
+                if is_notification_hours:
+                    try:
+                        await send_expiry_dm(
+                            guild,
+                            loa_entry,
+                            role_restored=role_restored,
+                            member=await _member(user_id),
+                        )
+                    except Exception as e:
+                        logger.warning(f"[LOA LOOP] Failed to send expiry DM for LOA #{loa_entry['id']}: {e}")
+                        await report_failure(
+                            guild,
+                            "LOA Loop",
+                            f"Failed to send expiry DM for LOA #{loa_entry['id']}.",
+                            e,
+                        )
+                    to_notify_ids.append(loa_entry["id"])
+                elif added is None:
+                    # If user left the server, mark notified anyway
+                    if await _member(user_id) is None:
+                        to_notify_ids.append(loa_entry["id"])
+
+            # Bulk DB writes — replace N individual round-trips with 2 queries
+            await loa_repository.mark_expired_bulk(list(to_expire_ids))
+            await loa_repository.mark_notified_bulk(to_notify_ids)
+
+            # 3. Send pending DM notifications for previously expired LOAs
+            if is_notification_hours:
+                unnotified = await loa_repository.get_expired_unnotified(guild_id)
+                unnotified_to_mark: list[int] = []
+                for loa_entry in unnotified:
+                    member = await _member(loa_entry["user_id"])
+                    has_active = (
+                        member is not None
+                        and active_role is not None
+                        and active_role in member.roles
+                    )
+
+                    try:
+                        await send_expiry_dm(
+                            guild, loa_entry, role_restored=has_active, member=member
+                        )
+                    except Exception as e:
+                        logger.warning(f"[LOA LOOP] Failed to send expiry DM for unnotified LOA #{loa_entry['id']}: {e}")
+                        await report_failure(
+                            guild,
+                            "LOA Loop",
+                            f"Failed to send expiry DM for unnotified LOA #{loa_entry['id']}.",
+                            e,
+                        )
+                    unnotified_to_mark.append(loa_entry["id"])
+                await loa_repository.mark_notified_bulk(unnotified_to_mark)
+
+            # 4. Update summary if anything changed
+            if summary_needs_update:
+                schedule_summary_update(self.bot, guild_id)
+        except Exception as e:
+            logger.error(f"[LOA LOOP] Guild {guild.name} check failed: {e}", exc_info=True)
+            await report_failure(
+                guild,
+                "LOA Loop",
+                "Hourly LOA check failed for this guild.",
+                e,
+            )
 
     @_loa_check_loop.before_loop
     async def _before_loa_check_loop(self):
@@ -1,18 +1,14 @@
-print('[DEBUG] minimal_configure_cog.py imported')
 import discord
 from discord.ext import commands
 from discord import app_commands
 from config import Config
+import logging
+
+logger = logging.getLogger(__name__)
 
 class MinimalConfigureCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        try:
-            tree = getattr(bot, 'tree', None)
-            if tree:
-                print(f"[DEBUG] Commands in MinimalConfigureCog: {[cmd.name for cmd in tree.get_commands()]}")
-        except Exception as e:
-            print(f"[DEBUG] Error printing commands in MinimalConfigureCog: {e}")
 
     @app_commands.command(name="configure_test", description="Minimal test: configure command only.")
     @app_commands.describe(
@@ -40,5 +36,5 @@ class MinimalConfigureCog(commands.Cog):
         await interaction.response.send_message(f"Minimal configure: {channel_id_int}", ephemeral=True)
 
 async def setup(bot):
-    print('[DEBUG] setup() called in minimal_configure_cog.py')
+    logger.debug("setup() called in minimal_configure_cog.py")
     await bot.add_cog(MinimalConfigureCog(bot))
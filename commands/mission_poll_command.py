@@ -1,8 +1,10 @@
 import discord
 from discord.ext import commands, tasks
+from collections import deque
 from discord import app_commands
 from typing import Optional
 from datetime import datetime, date, timedelta, timezone
+import asyncio
 import random
 import re
 import time
@@ -29,9 +31,17 @@ from services.mission_poll_service import (
     MAX_POLL_OPTIONS,
 )
 from services.schedule_config_repository import schedule_config_repository
+from services.schedule_embed_cache import refresh_schedule_message
 from services.event_repository import event_repository
 from services.raid_helper_service import raid_helper_service
 from services.log_channel_service import report_failure
+from services.permission_service import is_admin_or_editor
+from services.mission_poll_cache import (
+    cache_unassigned_events,
+    get_cached_unassigned_events,
+    invalidate_poll_choices,
+    invalidate_unassigned_events,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +51,9 @@ _SWEDISH_TZ = zoneinfo.ZoneInfo("Europe/Stockholm")
 # ─── Auto-poll default settings ───────────────────────────────────
 _AUTO_POLL_FRAMEWORK = "Framework 3.0"
 _AUTO_POLL_DURATION_HOURS = 36
+
+# Poll durations (hours) accepted by /missionpoll
+_VALID_DURATIONS = frozenset({12, 24, 36, 48, 60, 72})
 _AUTO_POLL_OPTIONS = 5
 _AUTO_POLL_COMPOSITION = "All"
 _AUTO_POLL_EXCLUSION_WEEKS = 8
@@ -56,8 +69,8 @@ _RH_INIT_UPDATE_THURSDAY = (21, 5)  # (hour, minute) bot fires on Thursday
 
 # ─── Autocomplete cache settings ──────────────────────────────────
 _AUTOCOMPLETE_COOLDOWN_SECONDS = 2.0   # Min interval between autocomplete DB queries per user
-_BRIEFING_CACHE_TTL = 300.0            # 5 min TTL for briefing-channel-id cache
-_EVENT_CACHE_TTL = 30.0                # 30 s TTL for unassigned-events cache
+_EVENT_POST_CACHE_SIZE = 50            # Recent events-channel messages kept for event-post linking
+_EVENT_POST_MAX_AGE = timedelta(days=60)  # Raid-Helper posts for upcoming events are always recent
 
 
 class MissionPollCommands(commands.Cog):
@@ -67,18 +80,30 @@ class MissionPollCommands(commands.Cog):
         self.bot = bot
 
         # ── Autocomplete caches ──
-        # Briefing channel id: {guild_id: (value, timestamp)}
-        self._briefing_cache: dict[int, tuple[Optional[int], float]] = {}
-        # Unassigned events: {guild_id: (list[Event], timestamp)}
-        self._event_cache: dict[int, tuple[list, float]] = {}
         # Per-user cooldown tracker: {user_id: last_autocomplete_ts}
         self._autocomplete_timestamps: dict[int, float] = {}
         # Track which (guild_id, event_date) combos already got an auto-poll today
         self._auto_poll_fired: set[tuple[int, date]] = set()
         # Track which (guild_id, event_date) combos already got a post-creation RH update today
         self._rh_init_update_fired: set[tuple[int, date]] = set()
-        # Registry of active polls: {poll_id: end_time} — avoids DB queries when no poll is due
+        # Registry of active polls: {poll_id: end_time}
         self._active_poll_end_times: dict[int, datetime] = {}
+        # One timer per active poll, firing at its end time: {poll_id: TimerHandle}
+        self._poll_timers: dict[int, asyncio.TimerHandle] = {}
+        # Polls currently being resolved (timer and safety loop must not both run one)
+        self._polls_in_progress: set[int] = set()
+        # Poll message IDs of tracked polls: {message_id: poll_id}, and the polls
+        # whose message has since been deleted (no need to fetch it to find out)
+        self._poll_message_ids: dict[int, int] = {}
+        self._deleted_poll_ids: set[int] = set()
+        self._background_tasks: set[asyncio.Task] = set()
+        # Recent messages per events channel, newest first: {channel_id: deque[Message]}.
+        # Filled on first lookup, then kept current by the message listeners.
+        self._event_posts: dict[int, deque[discord.Message]] = {}
+        # Resolved events channel per guild (None = no channel named "events")
+        self._events_channel_ids: dict[int, Optional[int]] = {}
+        # Resolved @Active role per guild (None = guild has no such role)
+        self._active_role_ids: dict[int, Optional[int]] = {}
 
     async def cog_load(self):
         """Called when the cog is loaded. Start background tasks."""
@@ -89,7 +114,7 @@ class MissionPollCommands(commands.Cog):
                 end_time = poll["poll_end_time"]
                 if end_time.tzinfo is None:
                     end_time = end_time.replace(tzinfo=timezone.utc)
-                self._active_poll_end_times[poll["id"]] = end_time
+                self.track_poll(poll["id"], end_time, poll["poll_message_id"])
             logger.info(f"Loaded {len(self._active_poll_end_times)} active poll(s) into registry")
         except Exception as e:
             logger.warning(f"Could not load active polls into registry on startup: {e}")
@@ -106,44 +131,37 @@ class MissionPollCommands(commands.Cog):
         self._poll_monitor_loop.cancel()
         self._auto_poll_loop.cancel()
         self._rh_init_update_loop.cancel()
+        for handle in self._poll_timers.values():
+            handle.cancel()
+        self._poll_timers.clear()
 
-    # ─── Helper: get briefing channel ID from config (cached) ──────────
-    async def _get_briefing_channel_id(self, guild_id: int, *, use_cache: bool = False) -> Optional[int]:
+    # ─── Helper: get briefing channel ID from config ───────────────────
+    async def _get_briefing_channel_id(self, guild_id: int) -> Optional[int]:
         """Return the briefing channel ID for a guild.
 
-        When *use_cache* is True the value is served from an in-memory
-        cache (TTL = ``_BRIEFING_CACHE_TTL``) to avoid hitting the DB on
-        every autocomplete keystroke.
+        Served from schedule_config_repository's per-guild cache, which
+        /configure invalidates — autocomplete keystrokes don't hit the DB.
         """
-        now = time.monotonic()
-        if use_cache:
-            cached = self._briefing_cache.get(guild_id)
-            if cached and (now - cached[1]) < _BRIEFING_CACHE_TTL:
-                return cached[0]
-
         config = await schedule_config_repository.get_config(guild_id)
-        value = config.get("briefing_channel_id") if config else None
-        self._briefing_cache[guild_id] = (value, now)
-        return value
+        return config.get("briefing_channel_id") if config else None
 
     # ─── Helper: get unassigned mission events in next 2 weeks (cached) ─
     async def _get_upcoming_unassigned_events(self, guild_id: int, *, use_cache: bool = False):
         """Return upcoming unassigned Mission events.
 
-        With *use_cache* the result list is reused for ``_EVENT_CACHE_TTL``
-        seconds so rapid autocomplete calls don't spam the database.
+        With *use_cache* the result list is reused for a short TTL (see
+        services.mission_poll_cache) so rapid autocomplete calls don't spam
+        the database.
         """
-        now = time.monotonic()
         if use_cache:
-            cached = self._event_cache.get(guild_id)
-            if cached and (now - cached[1]) < _EVENT_CACHE_TTL:
-                return cached[0]
+            cached = get_cached_unassigned_events(guild_id)
+            if cached is not None:
+                return cached
 
         today = date.today()
         end_date = today + timedelta(weeks=2)
-        events = await event_repository.get_events_by_guild_and_date_range(guild_id, today, end_date)
-        result = [e for e in events if e.type == "Mission" and not e.name.strip()]
-        self._event_cache[guild_id] = (result, now)
+        result = await event_repository.get_unassigned_missions_by_range(guild_id, today, end_date)
+        cache_unassigned_events(guild_id, result)
         return result
 
     # ─── Helper: autocomplete cooldown check ───────────────────────────
@@ -161,6 +179,23 @@ class MissionPollCommands(commands.Cog):
         return False
 
     # ─── Helper: find Raid-Helper event post in the events channel ─────
+    def _events_channel(self, guild: discord.Guild) -> Optional[discord.TextChannel]:
+        """Return the guild's events channel, resolving it by name on first use."""
+        if guild.id not in self._events_channel_ids:
+            # Find the events channel by name pattern (e.g. "events📅❗")
+            ch = discord.utils.find(lambda c: "events" in c.name.lower(), guild.text_channels)
+            self._events_channel_ids[guild.id] = ch.id if ch else None
+        channel_id = self._events_channel_ids[guild.id]
+        return guild.get_channel(channel_id) if channel_id else None
+
+    def _active_role(self, guild: discord.Guild) -> Optional[discord.Role]:
+        """Return the guild's @Active role, resolving it by name on first use."""
+        if guild.id not in self._active_role_ids:
+            role = discord.utils.get(guild.roles, name="Active")
+            self._active_role_ids[guild.id] = role.id if role else None
+        role_id = self._active_role_ids[guild.id]
+        return guild.get_role(role_id) if role_id else None
+
     async def _find_event_post_link(self, guild: discord.Guild, event_date: date) -> str | None:
         """Search for a Raid-Helper event post matching the given date.
 
@@ -168,13 +203,7 @@ class MissionPollCommands(commands.Cog):
         messages for an embed that mentions the target date.
         Returns a Discord message URL or None.
         """
-        # Find the events channel by name pattern (e.g. "events📅❗")
-        events_channel = None
-        for ch in guild.text_channels:
-            if "events" in ch.name.lower():
-                events_channel = ch
-                break
-
+        events_channel = self._events_channel(guild)
         if not events_channel:
             logger.debug("No events channel found for event-post linking")
             return None
@@ -185,48 +214,140 @@ class MissionPollCommands(commands.Cog):
         day_num = event_date.day                     # 15
         month_name = event_date.strftime("%B")       # "February"
         iso_str = event_date.isoformat()             # "2026-02-15"
-        # Also try DD/MM and DD.MM variants
-        search_variants = [
-            f"{day_name}",                           # at minimum the weekday
-            f"{day_num} {month_name}",               # "15 February"
-            f"{month_name} {day_num}",               # "February 15"
+        # Weekday plus at least one date indicator must both appear; compiled
+        # once per lookup so each haystack is matched with two regex searches.
+        day_re = re.compile(re.escape(day_name.lower()))
+        date_re = re.compile("|".join(map(re.escape, [
+            f"{day_num} {month_name}".lower(),       # "15 february"
+            f"{month_name} {day_num}".lower(),       # "february 15"
             iso_str,                                 # "2026-02-15"
-            event_date.strftime("%d/%m"),             # "15/02"
-        ]
+            event_date.strftime("%d/%m"),            # "15/02"
+        ])))
 
+        def _matches(text: str) -> bool:
+            return day_re.search(text) is not None and date_re.search(text) is not None
+
+        cutoff = datetime.now(timezone.utc) - _EVENT_POST_MAX_AGE
         try:
-            async for msg in events_channel.history(limit=50, oldest_first=False):
+            for msg in await self._recent_event_posts(events_channel):
+                if msg.created_at < cutoff:
+                    break  # newest first — everything after this is older still
                 # Check embeds (Raid-Helper posts as embeds)
                 for embed in msg.embeds:
-                    haystack = " ".join(filter(None, [
-                        embed.title or "",
-                        embed.description or "",
-                        " ".join(f.name + " " + f.value for f in embed.fields),
-                    ])).lower()
-
-                    # Need at least the weekday AND one date indicator
-                    has_day = day_name.lower() in haystack
-                    has_date = any(v.lower() in haystack for v in search_variants[1:])
-                    if has_day and has_date:
-                        url = f"https://discord.com/channels/{guild.id}/{events_channel.id}/{msg.id}"
-                        logger.info(f"Found event post for {event_date}: {url}")
-                        return url
+                    # Title/description first; only build the fields text
+                    # (the bulk of a Raid-Helper embed) when that isn't enough.
+                    title_desc = f"{embed.title or ''} {embed.description or ''}".lower()
+                    if not _matches(title_desc):
+                        if not embed.fields:
+                            continue
+                        # title_desc is already lowercased — only lower the fields text
+                        fields_text = " ".join(f"{f.name} {f.value}" for f in embed.fields)
+                        haystack = f"{title_desc} {fields_text.lower()}"
+                        if not _matches(haystack):
+                            continue
+
+                    url = f"https://discord.com/channels/{guild.id}/{events_channel.id}/{msg.id}"
+                    logger.info(f"Found event post for {event_date}: {url}")
+                    return url
 
                 # Also check plain message content as fallback
-                if msg.content:
-                    content_lower = msg.content.lower()
-                    has_day = day_name.lower() in content_lower
-                    has_date = any(v.lower() in content_lower for v in search_variants[1:])
-                    if has_day and has_date:
-                        url = f"https://discord.com/channels/{guild.id}/{events_channel.id}/{msg.id}"
-                        logger.info(f"Found event post for {event_date}: {url}")
-                        return url
+                if msg.content and _matches(msg.content.lower()):
+                    url = f"https://discord.com/channels/{guild.id}/{events_channel.id}/{msg.id}"
+                    logger.info(f"Found event post for {event_date}: {url}")
+                    return url
         except Exception as e:
             logger.warning(f"Error searching events channel for event post: {e}")
 
         logger.debug(f"No event post found for {event_date}")
         return None
 
+    async def _recent_event_posts(self, channel: discord.TextChannel) -> deque[discord.Message]:
+        """Return the channel's recent messages (newest first), fetching history only on a cache miss."""
+        cached = self._event_posts.get(channel.id)
+        if cached is None:
+            cutoff = datetime.now(timezone.utc) - _EVENT_POST_MAX_AGE
+            cached = deque(
+                [
+                    m async for m in channel.history(
+                        limit=_EVENT_POST_CACHE_SIZE, after=cutoff, oldest_first=False
+                    )
+                ],
+                maxlen=_EVENT_POST_CACHE_SIZE,
+            )
+            self._event_posts[channel.id] = cached
+        return cached
+
+    # ─── Events-channel cache maintenance ──────────────────────────────
+    # Role creates/renames/deletes can change which role is @Active
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role):
+        self._active_role_ids.pop(role.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self._active_role_ids.pop(role.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        if before.name != after.name:
+            self._active_role_ids.pop(after.guild.id, None)
+
+    # Channel creates/renames/deletes can change which channel is the events channel
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel):
+        self._events_channel_ids.pop(channel.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        self._events_channel_ids.pop(channel.guild.id, None)
+        self._event_posts.pop(channel.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before, after):
+        if before.name != after.name:
+            self._events_channel_ids.pop(after.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        cached = self._event_posts.get(message.channel.id)
+        if cached is not None:
+            cached.appendleft(message)  # maxlen drops the oldest
+
+    @commands.Cog.listener()
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        cached = self._event_posts.get(payload.channel_id)
+        if cached is None:
+            return
+        updated = getattr(payload, "message", None)
+        if updated is None:
+            # Older discord.py without the parsed message — refetch on next lookup
+            self._event_posts.pop(payload.channel_id, None)
+            return
+        for i, msg in enumerate(cached):
+            if msg.id == payload.message_id:
+                cached[i] = updated
+                break
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        poll_id = self._poll_message_ids.get(payload.message_id)
+        if poll_id is not None:
+            self._deleted_poll_ids.add(poll_id)
+        cached = self._event_posts.get(payload.channel_id)
+        if cached is None:
+            return
+        for msg in cached:
+            if msg.id == payload.message_id:
+                cached.remove(msg)
+                break
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        for message_id in payload.message_ids:
+            poll_id = self._poll_message_ids.get(message_id)
+            if poll_id is not None:
+                self._deleted_poll_ids.add(poll_id)
+
     # ─── The slash command ─────────────────────────────────────────────
     @app_commands.guilds(Config.GUILD_ID)
     @app_commands.command(
@@ -263,10 +384,8 @@ class MissionPollCommands(commands.Cog):
             return
         member = interaction.user
         if not isinstance(member, discord.Member):
-            member = await guild.fetch_member(interaction.user.id)
-        is_admin = any(getattr(r.permissions, "administrator", False) for r in member.roles)
-        has_editor = any(r.name.strip().lower() == "editor" for r in member.roles)
-        if not (is_admin or has_editor):
+            member = guild.get_member(interaction.user.id) or await guild.fetch_member(interaction.user.id)
+        if not is_admin_or_editor(member):
             await interaction.response.send_message(
                 "❌ You must be an admin or have the @Editor role to use this command.",
                 ephemeral=True,
@@ -283,7 +402,7 @@ class MissionPollCommands(commands.Cog):
             return
 
         # ── Validate duration ──
-        if duration not in (12, 24, 36, 48, 60, 72):
+        if duration not in _VALID_DURATIONS:
             await interaction.followup.send(
                 "❌ Duration must be one of: 12, 24, 36, 48, 60, 72 hours.", ephemeral=True
             )
@@ -464,7 +583,7 @@ class MissionPollCommands(commands.Cog):
         poll_end_dt = datetime.now(timezone.utc) + timedelta(hours=duration)
 
         # Find @Active role to mention in the poll message
-        active_role = discord.utils.get(guild.roles, name="Active")
+        active_role = self._active_role(guild)
         poll_content = f"{active_role.mention} Vote for the next mission!" if active_role else None
 
         try:
@@ -514,7 +633,8 @@ class MissionPollCommands(commands.Cog):
             links_message_id=links_message.id if links_message else None,
         )
         if new_poll_id:
-            self._active_poll_end_times[new_poll_id] = poll_end_dt
+            self.track_poll(new_poll_id, poll_end_dt, poll_message.id)
+            invalidate_poll_choices(guild.id)
             logger.info(f"Registered poll #{new_poll_id} in monitor registry (ends {poll_end_dt})")
 
         confirmation_msg = (
@@ -559,10 +679,8 @@ class MissionPollCommands(commands.Cog):
 
         member = interaction.user
         if not isinstance(member, discord.Member):
-            member = await guild.fetch_member(interaction.user.id)
-        is_admin = any(getattr(r.permissions, "administrator", False) for r in member.roles)
-        has_editor = any(r.name.strip().lower() == "editor" for r in member.roles)
-        if not (is_admin or has_editor):
+            member = guild.get_member(interaction.user.id) or await guild.fetch_member(interaction.user.id)
+        if not is_admin_or_editor(member):
             await interaction.response.send_message(
                 "❌ You must be an admin or have the @Editor role to use this command.",
                 ephemeral=True,
@@ -605,8 +723,7 @@ class MissionPollCommands(commands.Cog):
             return
 
         # ── Random selection ──
-        random.shuffle(remaining)
-        selected = remaining[:options]
+        selected = random.sample(remaining, min(options, len(remaining)))
 
         # ── Build embed ──
         fw_abbrev = abbreviate_framework(framework)
@@ -648,7 +765,7 @@ class MissionPollCommands(commands.Cog):
                 return []
             if self._is_autocomplete_throttled(interaction.user.id):
                 return self._filter_framework_choices(current)
-            briefing_channel_id = await self._get_briefing_channel_id(guild.id, use_cache=True)
+            briefing_channel_id = await self._get_briefing_channel_id(guild.id)
             if not briefing_channel_id:
                 return [app_commands.Choice(name="⚠️ Run /configure first", value="NONE")]
             await forum_tag_service.ensure_cache(guild, briefing_channel_id)
@@ -668,7 +785,7 @@ class MissionPollCommands(commands.Cog):
                 return []
             if self._is_autocomplete_throttled(interaction.user.id):
                 return self._filter_composition_choices(current)
-            briefing_channel_id = await self._get_briefing_channel_id(guild.id, use_cache=True)
+            briefing_channel_id = await self._get_briefing_channel_id(guild.id)
             if not briefing_channel_id:
                 return [app_commands.Choice(name="⚠️ Run /configure first", value="NONE")]
             await forum_tag_service.ensure_cache(guild, briefing_channel_id)
@@ -707,7 +824,7 @@ class MissionPollCommands(commands.Cog):
                 # Serve from tag cache only (no DB / API calls)
                 return self._filter_framework_choices(current)
 
-            briefing_channel_id = await self._get_briefing_channel_id(guild.id, use_cache=True)
+            briefing_channel_id = await self._get_briefing_channel_id(guild.id)
             if not briefing_channel_id:
                 return [app_commands.Choice(name="⚠️ Run /configure first", value="NONE")]
 
@@ -720,11 +837,14 @@ class MissionPollCommands(commands.Cog):
     @staticmethod
     def _filter_framework_choices(current: str) -> list[app_commands.Choice[str]]:
         """Return framework choices from the already-populated tag cache."""
+        needle = current.lower()
         choices = []
-        for tag_name in forum_tag_service.framework_tags:
-            if current.lower() in tag_name.lower():
+        for tag_name, tag_lc in forum_tag_service.framework_tags_lc:
+            if needle in tag_lc:
                 choices.append(app_commands.Choice(name=tag_name, value=tag_name))
-        return choices[:25]
+                if len(choices) == 25:
+                    break
+        return choices
 
     # ─── Autocomplete: composition ─────────────────────────────────────
     @missionpoll_command.autocomplete("composition")
@@ -739,7 +859,7 @@ class MissionPollCommands(commands.Cog):
             if self._is_autocomplete_throttled(interaction.user.id):
                 return self._filter_composition_choices(current)
 
-            briefing_channel_id = await self._get_briefing_channel_id(guild.id, use_cache=True)
+            briefing_channel_id = await self._get_briefing_channel_id(guild.id)
             if not briefing_channel_id:
                 return [app_commands.Choice(name="⚠️ Run /configure first", value="NONE")]
 
@@ -752,11 +872,14 @@ class MissionPollCommands(commands.Cog):
     @staticmethod
     def _filter_composition_choices(current: str) -> list[app_commands.Choice[str]]:
         """Return composition choices from the already-populated tag cache."""
+        needle = current.lower()
         choices = [app_commands.Choice(name="All (any composition)", value="All")]
-        for tag_name in forum_tag_service.composition_tags:
-            if current.lower() in tag_name.lower() or not current:
+        for tag_name, tag_lc in forum_tag_service.composition_tags_lc:
+            if needle in tag_lc:
                 choices.append(app_commands.Choice(name=tag_name, value=tag_name))
-        return choices[:25]
+                if len(choices) == 25:
+                    break
+        return choices
 
     # ─── Autocomplete: event ───────────────────────────────────────────
     @missionpoll_command.autocomplete("event")
@@ -1118,7 +1241,7 @@ class MissionPollCommands(commands.Cog):
 
         poll_end_dt = datetime.now(timezone.utc) + timedelta(hours=_AUTO_POLL_DURATION_HOURS)
 
-        active_role = discord.utils.get(guild.roles, name="Active")
+        active_role = self._active_role(guild)
         poll_content = f"{active_role.mention} Vote for the next mission!" if active_role else None
 
         try:
@@ -1169,7 +1292,8 @@ class MissionPollCommands(commands.Cog):
             links_message_id=links_message.id if links_message else None,
         )
         if new_poll_id:
-            self._active_poll_end_times[new_poll_id] = poll_end_dt
+            self.track_poll(new_poll_id, poll_end_dt, poll_message.id)
+            invalidate_poll_choices(guild.id)
             logger.info(f"Registered auto-poll #{new_poll_id} in monitor registry (ends {poll_end_dt})")
 
         logger.info(
@@ -1207,6 +1331,7 @@ class MissionPollCommands(commands.Cog):
                 except Exception:
                     pass
             return
+        invalidate_unassigned_events(target_event.guild_id)
 
         logger.info(
             "Auto-poll: single mission '%s' auto-scheduled for %s",
@@ -1241,13 +1366,10 @@ class MissionPollCommands(commands.Cog):
 
         # ── Update schedule embed ──
         try:
-            from services.schedule_embed_service import build_schedule_embed
-
             sched_channel = guild.get_channel(config["channel_id"])
             if sched_channel:
-                msg = await sched_channel.fetch_message(config["message_id"])
-                embed = await build_schedule_embed(guild)
-                await msg.edit(embed=embed)
+                msg = sched_channel.get_partial_message(config["message_id"])
+                await refresh_schedule_message(guild, msg)
         except Exception as e:
             logger.warning("Auto-poll: failed to update schedule embed: %s", e)
 
@@ -1264,30 +1386,38 @@ class MissionPollCommands(commands.Cog):
         except Exception as e:
             logger.warning("Auto-poll: failed to send announcement: %s", e)
 
-    # ─── Background task: poll monitor (every 1 minute) ──────────────
-    @tasks.loop(minutes=1)
+    # ─── Background task: poll monitor safety net (every 30 minutes) ──
+    # Polls are normally resolved by their own timer (see track_poll); this
+    # sweep only catches anything a timer missed.
+    @tasks.loop(minutes=30)
     async def _poll_monitor_loop(self):
         """Check for ended polls and process results."""
         try:
             now = datetime.now(timezone.utc)
 
-            # Skip DB entirely if no tracked poll has reached its end time yet
-            if not any(end_time <= now for end_time in self._active_poll_end_times.values()):
+            # Always ask the DB — a poll whose processing failed is no longer
+            # in the in-memory registry but is still active there
+            ended = await mission_poll_repository.get_ended_polls(now)
+            if not ended:
                 return
 
-            active_polls = await mission_poll_repository.get_active_polls()
+            # Polls are independent; cap concurrency to stay clear of rate limits
+            sem = asyncio.Semaphore(5)
 
-            for poll_data in active_polls:
-                poll_end = poll_data["poll_end_time"]
-                # Ensure timezone-aware
-                if poll_end.tzinfo is None:
-                    poll_end = poll_end.replace(tzinfo=timezone.utc)
+            async def _process(poll_data: dict) -> None:
+                async with sem:
+                    # A timer may have resolved it since the list was fetched
+                    fresh = await mission_poll_repository.get_poll_by_id(poll_data["id"])
+                    if not fresh or fresh["status"] != "active":
+                        return
 
-                if now < poll_end:
-                    continue  # Not ended yet
+                    logger.info(f"Processing ended poll #{poll_data['id']}")
+                    await self._run_ended_poll(fresh)
 
-                logger.info(f"Processing ended poll #{poll_data['id']}")
-                await self._process_ended_poll(poll_data)
+            results = await asyncio.gather(*(_process(p) for p in ended), return_exceptions=True)
+            errors = [r for r in results if isinstance(r, Exception)]
+            if errors:
+                raise errors[0]
 
         except Exception as e:
             logger.error(f"Poll monitor loop error: {e}")
@@ -1305,14 +1435,80 @@ class MissionPollCommands(commands.Cog):
     async def _before_poll_monitor(self):
         await self.bot.wait_until_ready()
 
+    def track_poll(self, poll_id: int, end_time: datetime, message_id: Optional[int] = None) -> None:
+        """Register an active poll and schedule its resolution at *end_time*."""
+        self._active_poll_end_times[poll_id] = end_time
+        if message_id:
+            self._poll_message_ids[message_id] = poll_id
+        handle = self._poll_timers.pop(poll_id, None)
+        if handle is not None:
+            handle.cancel()
+        delay = max(0.0, (end_time - datetime.now(timezone.utc)).total_seconds())
+        self._poll_timers[poll_id] = asyncio.get_running_loop().call_later(
+            delay, self._fire_poll_timer, poll_id
+        )
+
     def untrack_poll(self, poll_id: int) -> None:
-        """Remove a poll from the in-memory end-time registry."""
+        """Remove a poll from the in-memory end-time registry and cancel its timer."""
         self._active_poll_end_times.pop(poll_id, None)
+        handle = self._poll_timers.pop(poll_id, None)
+        if handle is not None:
+            handle.cancel()
+        self._deleted_poll_ids.discard(poll_id)
+        for message_id, tracked_id in list(self._poll_message_ids.items()):
+            if tracked_id == poll_id:
+                del self._poll_message_ids[message_id]
+
+    def _fire_poll_timer(self, poll_id: int) -> None:
+        self._poll_timers.pop(poll_id, None)
+        task = asyncio.create_task(self._on_poll_timer(poll_id))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _on_poll_timer(self, poll_id: int) -> None:
+        """Resolve a poll when its timer fires, if it is still active and due."""
+        try:
+            # Timers for polls that ended while offline fire during startup
+            await self.bot.wait_until_ready()
+            poll_data = await mission_poll_repository.get_poll_by_id(poll_id)
+            if not poll_data or poll_data["status"] != "active":
+                self.untrack_poll(poll_id)
+                return
+            poll_end = poll_data["poll_end_time"]
+            if poll_end.tzinfo is None:
+                poll_end = poll_end.replace(tzinfo=timezone.utc)
+            if datetime.now(timezone.utc) < poll_end:
+                self.track_poll(poll_id, poll_end)  # end time moved — reschedule
+                return
+            logger.info(f"Processing ended poll #{poll_id} (timer)")
+            await self._run_ended_poll(poll_data)
+        except Exception as e:
+            logger.error(f"Poll timer for poll #{poll_id} failed: {e}", exc_info=True)
+            await report_failure(
+                self.bot.get_guild(Config.GUILD_ID),
+                "Poll Monitor",
+                f"Processing poll #{poll_id} failed.",
+                e,
+            )
+
+    async def _run_ended_poll(self, poll_data: dict) -> None:
+        """Run _process_ended_poll unless the poll is already being resolved."""
+        poll_id = poll_data["id"]
+        if poll_id in self._polls_in_progress:
+            return
+        self._polls_in_progress.add(poll_id)
+        try:
+            await self._process_ended_poll(poll_data)
+        finally:
+            self._polls_in_progress.discard(poll_id)
 
     async def _process_ended_poll(self, poll_data: dict):
         """Process a poll that has ended: determine winner & auto-schedule."""
+        # Seen deleted by on_raw_message_delete — no need to fetch it to find out
+        message_deleted = poll_data["id"] in self._deleted_poll_ids
         # Remove from registry immediately — we are handling it now regardless of outcome
-        self._active_poll_end_times.pop(poll_data["id"], None)
+        self.untrack_poll(poll_data["id"])
+        invalidate_poll_choices(poll_data["guild_id"])
 
         guild = self.bot.get_guild(poll_data["guild_id"])
         if not guild:
@@ -1344,9 +1540,17 @@ class MissionPollCommands(commands.Cog):
                 )
             return
 
-        try:
-            poll_message = await channel.fetch_message(poll_data["poll_message_id"])
-        except discord.NotFound:
+        if not message_deleted:
+            # The poll message and the target event are independent lookups
+            poll_message, target_event = await asyncio.gather(
+                channel.fetch_message(poll_data["poll_message_id"]),
+                event_repository.get_event_by_id(poll_data["target_event_id"]),
+                return_exceptions=True,
+            )
+            if isinstance(target_event, BaseException):
+                raise target_event
+
+        if message_deleted or isinstance(poll_message, discord.NotFound):
             logger.warning(f"Poll message {poll_data['poll_message_id']} deleted")
             await mission_poll_repository.mark_failed(poll_data["id"])
             error_msg = (
@@ -1359,8 +1563,8 @@ class MissionPollCommands(commands.Cog):
             if not dm_ok and log_channel:
                 await log_channel.send(error_msg)
             return
-        except Exception as e:
-            logger.error(f"Failed to fetch poll message: {e}")
+        if isinstance(poll_message, BaseException):
+            logger.error(f"Failed to fetch poll message: {poll_message}")
             await mission_poll_repository.mark_failed(poll_data["id"])
             return
 
@@ -1370,20 +1574,23 @@ class MissionPollCommands(commands.Cog):
             await mission_poll_repository.mark_failed(poll_data["id"])
             return
 
-        # Tally votes per answer index
-        vote_counts = {}
+        # Find the top vote count and every answer index that shares it
+        max_votes = 0
+        tied_indices = []
         for i, answer in enumerate(poll_message.poll.answers):
-            vote_counts[i] = answer.vote_count
+            votes = answer.vote_count
+            if votes > max_votes:
+                max_votes, tied_indices = votes, [i]
+            elif votes == max_votes and votes:
+                tied_indices.append(i)
 
         # Determine winner
         thread_ids = poll_data["mission_thread_ids"]
-        if not vote_counts or all(v == 0 for v in vote_counts.values()):
+        if not tied_indices:
             # Zero votes — random pick
             winner_idx = random.randint(0, len(thread_ids) - 1)
             logger.info(f"Poll #{poll_data['id']} had 0 votes, randomly selected index {winner_idx}")
         else:
-            max_votes = max(vote_counts.values())
-            tied_indices = [i for i, v in vote_counts.items() if v == max_votes]
             winner_idx = random.choice(tied_indices)
             logger.info(
                 f"Poll #{poll_data['id']} winner: index {winner_idx} "
@@ -1438,13 +1645,13 @@ class MissionPollCommands(commands.Cog):
         author_name = await extract_author_from_thread(winning_thread)
         mission_name = winning_thread.name
 
-        # Get the target event
-        target_event = await event_repository.get_event_by_id(poll_data["target_event_id"])
         if not target_event:
             logger.warning(f"Target event {poll_data['target_event_id']} not found")
             await mission_poll_repository.mark_failed(poll_data["id"])
             return
 
+        event_label = format_event_date(target_event.date)
+
         # Check event is still unassigned
         if target_event.name.strip():
             logger.warning(
@@ -1453,46 +1660,50 @@ class MissionPollCommands(commands.Cog):
             if log_channel:
                 await log_channel.send(
                     f"⚠️ Poll #{poll_data['id']} winner was **{mission_name}**, but event "
-                    f"**{format_event_date(target_event.date)}** already has *{target_event.name}* assigned."
+                    f"**{event_label}** already has *{target_event.name}* assigned."
                 )
             await mission_poll_repository.mark_completed(poll_data["id"], winning_thread_id)
             return
 
-        # Auto-schedule the event
+        # Auto-schedule the event and complete the poll in one statement
         # Use creator_id=0 to indicate system/poll, creator_name = extracted author
-        success = await event_repository.update_event(
+        success = await mission_poll_repository.finalize_poll(
+            poll_data["id"],
             target_event.id,
-            name=mission_name,
-            creator_id=0,
+            mission_name=mission_name,
             creator_name=author_name,
+            winning_thread_id=winning_thread_id,
+            creator_id=0,
         )
 
         if success:
-            await mission_poll_repository.mark_completed(poll_data["id"], winning_thread_id)
+            invalidate_unassigned_events(target_event.guild_id)
             logger.info(
                 f"Auto-scheduled '{mission_name}' by {author_name} for "
-                f"{format_event_date(target_event.date)}"
+                f"{event_label}"
             )
 
             # ── Cleanup: delete poll + links messages ──
-            try:
-                await poll_message.delete()
-                logger.info(f"Deleted poll message {poll_message.id}")
-            except Exception as e:
-                logger.warning(f"Failed to delete poll message: {e}")
+            async def _delete_poll_message() -> None:
+                try:
+                    await poll_message.delete()
+                    logger.info(f"Deleted poll message {poll_message.id}")
+                except Exception as e:
+                    logger.warning(f"Failed to delete poll message: {e}")
 
-            links_msg_id = poll_data.get("links_message_id")
-            if links_msg_id and channel:
+            async def _delete_links_message() -> None:
+                links_msg_id = poll_data.get("links_message_id")
+                if not links_msg_id or not channel:
+                    return
                 try:
-                    links_msg = await channel.fetch_message(links_msg_id)
-                    await links_msg.delete()
+                    # Deleting only needs the ID — skip the GET round-trip
+                    await channel.get_partial_message(links_msg_id).delete()
                     logger.info(f"Deleted links embed message {links_msg_id}")
                 except Exception as e:
                     logger.warning(f"Failed to delete links embed message: {e}")
 
             # ── Update Raid-Helper event with briefing content ──
-            rh_updated = False
-            if winning_thread:
+            async def _update_raid_helper() -> bool:
                 try:
                     # Look up training info for Thursdays
                     training_name = ""
@@ -1512,29 +1723,52 @@ class MissionPollCommands(commands.Cog):
                         training_name=training_name,
                         instructor_name=instructor_name,
                     )
-                    rh_updated = not rh_error
-                    if rh_updated:
+                    if not rh_error:
                         logger.info(
                             f"Raid-Helper event updated from briefing '{winning_thread.name}'"
                         )
-                    else:
-                        logger.warning(f"Raid-Helper update failed: {rh_error}")
-                        if log_channel:
-                            await log_channel.send(
-                                f"⚠️ Raid-Helper event auto-update failed for **{mission_name}** "
-                                f"({format_event_date(target_event.date)}): {rh_error}"
-                            )
+                        return True
+                    logger.warning(f"Raid-Helper update failed: {rh_error}")
+                    if log_channel:
+                        await log_channel.send(
+                            f"⚠️ Raid-Helper event auto-update failed for **{mission_name}** "
+                            f"({event_label}): {rh_error}"
+                        )
                 except Exception as e:
                     logger.warning(f"Failed to update Raid-Helper event from briefing: {e}")
                     if log_channel:
                         await log_channel.send(
                             f"⚠️ Raid-Helper event auto-update failed for **{mission_name}** "
-                            f"({format_event_date(target_event.date)}): {e}"
+                            f"({event_label}): {e}"
                         )
+                return False
 
-            # ── Find the Raid-Helper event post in the events channel ──
-            event_post_link = await self._find_event_post_link(
-                guild, target_event.date
+            # ── Update the schedule embed ──
+            async def _refresh_schedule() -> Optional[discord.abc.Messageable]:
+                try:
+                    config = await schedule_config_repository.get_config(guild.id)
+                    if not config:
+                        return None
+                    sched_channel = guild.get_channel(config["channel_id"])
+                    if not sched_channel:
+                        return None
+
+                    msg = sched_channel.get_partial_message(config["message_id"])
+                    await refresh_schedule_message(guild, msg)
+                    logger.info("Schedule embed updated after poll auto-schedule")
+                    return sched_channel
+                except Exception as e:
+                    logger.warning(f"Failed to update schedule embed after poll: {e}")
+                    return None
+
+            # These only share already-resolved inputs — overlap their round trips
+            _, _, rh_updated, sched_channel, event_post_link = await asyncio.gather(
+                _delete_poll_message(),
+                _delete_links_message(),
+                _update_raid_helper(),
+                _refresh_schedule(),
+                # ── Find the Raid-Helper event post in the events channel ──
+                self._find_event_post_link(guild, target_event.date),
             )
 
             # ── Build announcement ──
@@ -1544,50 +1778,41 @@ class MissionPollCommands(commands.Cog):
 
             announcement = (
                 f"✅ Poll ended — **{mission_name}** has been scheduled for "
-                f"**{format_event_date(target_event.date)}**"
+                f"**{event_label}**"
             )
 
             if rh_updated:
                 # Bot auto-updated the Raid-Helper event — no manual action needed
                 announcement += "\n📋 Raid-Helper event updated with briefing content."
 
-            # ── Update the schedule embed + send announcement ──
-            try:
-                config = await schedule_config_repository.get_config(guild.id)
-                if config:
-                    sched_channel = guild.get_channel(config["channel_id"])
-                    if sched_channel:
-                        from services.schedule_embed_service import build_schedule_embed
-
-                        msg = await sched_channel.fetch_message(config["message_id"])
-                        embed = await build_schedule_embed(guild)
-                        await msg.edit(embed=embed)
-                        logger.info("Schedule embed updated after poll auto-schedule")
-
-                        # Send visible announcement in the schedule channel
-                        try:
-                            await sched_channel.send(announcement)
-                        except Exception as e:
-                            logger.warning(f"Failed to send announcement to schedule channel: {e}")
-            except Exception as e:
-                logger.warning(f"Failed to update schedule embed after poll: {e}")
+            # Send visible announcement in the schedule channel
+            async def _announce() -> None:
+                if not sched_channel:
+                    return
+                try:
+                    await sched_channel.send(announcement)
+                except Exception as e:
+                    logger.warning(f"Failed to send announcement to schedule channel: {e}")
 
             # Also notify poll creator via DM (fall back to log channel)
-            dm_ok = False
-            if creator:
-                dm_ok = await send_dm_safe(creator, content=announcement, fallback_channel=log_channel)
-            if not dm_ok and log_channel:
-                try:
-                    await log_channel.send(announcement)
-                except Exception:
-                    pass
+            async def _notify_creator() -> None:
+                dm_ok = False
+                if creator:
+                    dm_ok = await send_dm_safe(creator, content=announcement, fallback_channel=log_channel)
+                if not dm_ok and log_channel:
+                    try:
+                        await log_channel.send(announcement)
+                    except Exception:
+                        pass
+
+            await asyncio.gather(_announce(), _notify_creator())
         else:
             logger.error(f"Failed to update event {target_event.id}")
             await mission_poll_repository.mark_failed(poll_data["id"])
             if log_channel:
                 await log_channel.send(
                     f"❌ Failed to auto-schedule poll #{poll_data['id']} winner "
-                    f"**{mission_name}** for {format_event_date(target_event.date)}."
+                    f"**{mission_name}** for {event_label}."
                 )
 
 
@@ -1614,10 +1839,8 @@ class MissionPollCommands(commands.Cog):
         # Permission check: admin or @Editor
         member = interaction.user
         if not isinstance(member, discord.Member):
-            member = await guild.fetch_member(interaction.user.id)
-        is_admin = any(getattr(r.permissions, "administrator", False) for r in member.roles)
-        has_editor = any(r.name.strip().lower() == "editor" for r in member.roles)
-        if not (is_admin or has_editor):
+            member = guild.get_member(interaction.user.id) or await guild.fetch_member(interaction.user.id)
+        if not is_admin_or_editor(member):
             await interaction.response.send_message(
                 "❌ You must be an admin or have the @Editor role to use this command.",
                 ephemeral=True,
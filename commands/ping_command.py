@@ -2,6 +2,9 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from config import Config
+from services import db_connection
+from services.schedule_config_repository import schedule_config_repository
+from services.schedule_embed_service import build_schedule_embed
 
 class PingCommand(commands.Cog):
     def __init__(self, bot):
@@ -13,13 +16,12 @@ class PingCommand(commands.Cog):
         # IMMEDIATELY defer the response to prevent timeout
         await interaction.response.defer(ephemeral=True)
         
-        from config import Config
         version = getattr(Config, "BOT_VERSION", "unknown")
+        stats = db_connection.pool_stats()
+        if stats:
+            version += f"\nDB pool: {stats['size']} open / {stats['idle']} idle (max {stats['max']})"
         
         # Update schedule message embed
-        from services.schedule_config_repository import schedule_config_repository
-        from services.schedule_embed_service import build_schedule_embed
-        
         try:
             config = await schedule_config_repository.get_config(interaction.guild.id)
             updated = False
@@ -28,7 +30,7 @@ class PingCommand(commands.Cog):
                 channel = interaction.guild.get_channel(config["channel_id"])
                 if channel:
                     try:
-                        msg = await channel.fetch_message(config["message_id"])
+                        msg = channel.get_partial_message(config["message_id"])
                         embed = await build_schedule_embed(interaction.guild)
                         await msg.edit(embed=embed)
                         updated = True
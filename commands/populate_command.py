@@ -4,6 +4,9 @@ from discord import app_commands
 from datetime import date, timedelta
 from config import Config
 from services import event_population_service
+from services.permission_service import is_admin_or_editor
+from services.schedule_config_repository import schedule_config_repository
+from services.schedule_embed_cache import refresh_schedule_message
 
 
 class PopulateCommand(commands.Cog):
@@ -26,11 +29,9 @@ class PopulateCommand(commands.Cog):
 
         member = interaction.user
         if not isinstance(member, discord.Member):
-            member = await guild.fetch_member(interaction.user.id)
+            member = guild.get_member(interaction.user.id) or await guild.fetch_member(interaction.user.id)
 
-        is_admin = any(getattr(r.permissions, 'administrator', False) for r in member.roles)
-        has_editor = any(r.name.strip().lower() == "editor" for r in member.roles)
-        if not (is_admin or has_editor):
+        if not is_admin_or_editor(member):
             await interaction.response.send_message(
                 "❌ You must be an admin or have the @Editor role to use this command.",
                 ephemeral=True,
@@ -57,16 +58,12 @@ class PopulateCommand(commands.Cog):
 
             # Refresh schedule message if configured
             try:
-                from services.schedule_config_repository import schedule_config_repository
-                from services.schedule_embed_service import build_schedule_embed
-
                 config = await schedule_config_repository.get_config(guild.id)
                 if config:
                     channel = guild.get_channel(config["channel_id"])
                     if channel:
-                        msg = await channel.fetch_message(config["message_id"])
-                        embed = await build_schedule_embed(guild)
-                        await msg.edit(embed=embed)
+                        msg = channel.get_partial_message(config["message_id"])
+                        await refresh_schedule_message(guild, msg)
             except Exception:
                 # Non-fatal; population succeeded even if embed refresh fails
                 pass
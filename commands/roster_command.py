@@ -1,6 +1,7 @@
 import discord
 from discord.ext import commands, tasks
 from discord import app_commands
+import asyncio
 import logging
 
 from config import Config
@@ -51,8 +52,7 @@ class RosterCommands(commands.Cog):
             old_channel = guild.get_channel(old_config["channel_id"])
             if old_channel:
                 try:
-                    old_msg = await old_channel.fetch_message(old_config["message_id"])
-                    await old_msg.delete()
+                    await old_channel.get_partial_message(old_config["message_id"]).delete()
                 except (discord.NotFound, discord.HTTPException):
                     pass
 
@@ -61,7 +61,7 @@ class RosterCommands(commands.Cog):
             "⏳ Scanning guild members… this may take a moment.",
             ephemeral=True,
         )
-        summary = await scan_roster(guild)
+        summary = await scan_roster(guild, force=True)
 
         # ── Post the roster embeds ──
         embeds = await build_roster_embeds(guild.id)
@@ -102,7 +102,7 @@ class RosterCommands(commands.Cog):
             return
 
         # ── Scan and update ──
-        summary = await scan_roster(interaction.guild)
+        summary = await scan_roster(interaction.guild, force=True)
         await update_roster_message(self.bot, interaction.guild_id)
 
         await interaction.followup.send(
@@ -119,14 +119,28 @@ class RosterCommands(commands.Cog):
     async def _roster_refresh_loop(self):
         """Hourly: re-scan members and update the roster embed."""
         try:
-            for guild in self.bot.guilds:
-                config = await roster_config_repository.get_config(guild.id)
-                if not config:
-                    continue
-
-                await scan_roster(guild)
-                await update_roster_message(self.bot, guild.id)
-                logger.info(f"Hourly roster refresh complete for {guild.name}")
+            # Guilds are independent; cap concurrency to stay clear of rate limits
+            sem = asyncio.Semaphore(4)
+
+            async def _refresh(guild: discord.Guild) -> None:
+                async with sem:
+                    config = await roster_config_repository.get_config(guild.id)
+                    if not config:
+                        return
+
+                    await scan_roster(guild)
+                    await update_roster_message(self.bot, guild.id)
+                    logger.info(f"Hourly roster refresh complete for {guild.name}")
+
+            guilds = list(self.bot.guilds)
+            results = await asyncio.gather(*(_refresh(g) for g in guilds), return_exceptions=True)
+            errors = []
+            for guild, result in zip(guilds, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Roster refresh failed for {guild.name}: {result}", exc_info=result)
+                    errors.append(result)
+            if errors:
+                raise errors[0]
 
         except Exception as e:
             logger.error(f"Roster refresh loop error: {e}", exc_info=True)
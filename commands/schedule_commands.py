@@ -5,6 +5,10 @@ from typing import Optional
 from config import Config
 from models import Event
 from services import event_repository, date_filter_service
+from services.permission_service import is_admin_or_editor
+from services.schedule_config_repository import schedule_config_repository
+from services.schedule_embed_cache import refresh_schedule_message
+from services.mission_poll_cache import invalidate_unassigned_events
 
 class ScheduleCommands(commands.Cog):
     """Discord slash commands for schedule management."""
@@ -35,10 +39,8 @@ class ScheduleCommands(commands.Cog):
         member = interaction.user
         # If not a Member object, fetch it
         if not isinstance(member, discord.Member):
-            member = await guild.fetch_member(interaction.user.id)
-        is_admin = any(getattr(r.permissions, 'administrator', False) for r in member.roles)
-        has_editor = any(r.name.strip().lower() == "editor" for r in member.roles)
-        if not (is_admin or has_editor):
+            member = guild.get_member(interaction.user.id) or await guild.fetch_member(interaction.user.id)
+        if not is_admin_or_editor(member):
             await interaction.response.send_message("❌ You must be an admin or have the @Editor role to use this command.", ephemeral=True)
             return
         await interaction.response.defer()
@@ -76,17 +78,15 @@ class ScheduleCommands(commands.Cog):
             )
             
             if success:
+                invalidate_unassigned_events(selected_event.guild_id)
                 # Update the schedule message after event update
-                from services.schedule_config_repository import schedule_config_repository
-                from services.schedule_embed_service import build_schedule_embed
                 config = await schedule_config_repository.get_config(interaction.guild.id)
                 if config:
                     channel = interaction.guild.get_channel(config["channel_id"])
                     if channel:
                         try:
-                            msg = await channel.fetch_message(config["message_id"])
-                            embed = await build_schedule_embed(interaction.guild)
-                            await msg.edit(embed=embed)
+                            msg = channel.get_partial_message(config["message_id"])
+                            await refresh_schedule_message(interaction.guild, msg)
                         except Exception as e:
                             await interaction.followup.send(f"Event updated, but failed to update schedule message: {e}", ephemeral=True)
                             return
@@ -169,12 +169,8 @@ class ScheduleCommands(commands.Cog):
 
         member = interaction.user
         if not isinstance(member, discord.Member):
-            member = await guild.fetch_member(interaction.user.id)
-        is_admin = any(
-            getattr(r.permissions, "administrator", False) for r in member.roles
-        )
-        has_editor = any(r.name.strip().lower() == "editor" for r in member.roles)
-        if not (is_admin or has_editor):
+            member = guild.get_member(interaction.user.id) or await guild.fetch_member(interaction.user.id)
+        if not is_admin_or_editor(member):
             await interaction.response.send_message(
                 "❌ You must be an admin or have the @Editor role to use this command.",
                 ephemeral=True,
@@ -211,18 +207,15 @@ class ScheduleCommands(commands.Cog):
             )
 
             if success:
+                invalidate_unassigned_events(selected_event.guild_id)
                 # Refresh the schedule embed
-                from services.schedule_config_repository import schedule_config_repository
-                from services.schedule_embed_service import build_schedule_embed
-
                 config = await schedule_config_repository.get_config(guild.id)
                 if config:
                     channel = guild.get_channel(config["channel_id"])
                     if channel:
                         try:
-                            msg = await channel.fetch_message(config["message_id"])
-                            embed = await build_schedule_embed(guild)
-                            await msg.edit(embed=embed)
+                            msg = channel.get_partial_message(config["message_id"])
+                            await refresh_schedule_message(guild, msg)
                         except Exception as e:
                             await interaction.followup.send(
                                 f"Event cleared, but failed to update schedule message: {e}",
@@ -287,12 +280,8 @@ class ScheduleCommands(commands.Cog):
 
         member = interaction.user
         if not isinstance(member, discord.Member):
-            member = await guild.fetch_member(interaction.user.id)
-        is_admin = any(
-            getattr(r.permissions, "administrator", False) for r in member.roles
-        )
-        has_editor = any(r.name.strip().lower() == "editor" for r in member.roles)
-        if not (is_admin or has_editor):
+            member = guild.get_member(interaction.user.id) or await guild.fetch_member(interaction.user.id)
+        if not is_admin_or_editor(member):
             await interaction.response.send_message(
                 "❌ You must be an admin or have the @Editor role to use this command.",
                 ephemeral=True,
@@ -329,18 +318,15 @@ class ScheduleCommands(commands.Cog):
             )
 
             if success:
+                invalidate_unassigned_events(selected_event.guild_id)
                 # Refresh the schedule embed
-                from services.schedule_config_repository import schedule_config_repository
-                from services.schedule_embed_service import build_schedule_embed
-
                 config = await schedule_config_repository.get_config(guild.id)
                 if config:
                     channel = guild.get_channel(config["channel_id"])
                     if channel:
                         try:
-                            msg = await channel.fetch_message(config["message_id"])
-                            embed = await build_schedule_embed(guild)
-                            await msg.edit(embed=embed)
+                            msg = channel.get_partial_message(config["message_id"])
+                            await refresh_schedule_message(guild, msg)
                         except Exception as e:
                             await interaction.followup.send(
                                 f"Event cancelled, but failed to update schedule message: {e}",
@@ -1,4 +1,5 @@
 import os
+import functools
 from dotenv import load_dotenv
 from version import __version__
 
@@ -10,10 +11,14 @@ class Config:
     
     # Discord Configuration
     DISCORD_BOT_TOKEN = os.getenv('DISCORD_BOT_TOKEN')
-    GUILD_ID = int(os.getenv('GUILD_ID', 0))
+    GUILD_ID = int(os.getenv('GUILD_ID', 0))  # Parsed once at import — a malformed value fails fast
     
     # Database Configuration
     NEONDB_CONNECTION_STRING = os.getenv('NEONDB_CONNECTION_STRING')
+    DB_POOL_MIN_SIZE = int(os.getenv('DB_POOL_MIN_SIZE', 1))
+    DB_POOL_MAX_SIZE = int(os.getenv('DB_POOL_MAX_SIZE', 10))
+    # Set to 0 when connecting through a transaction-mode pooler (e.g. Neon's -pooler host)
+    DB_STATEMENT_CACHE_SIZE = int(os.getenv('DB_STATEMENT_CACHE_SIZE', 1024))
     
     # Bot Configuration
     BOT_PREFIX = os.getenv('BOT_PREFIX', '!')
@@ -24,8 +29,13 @@ class Config:
     RAID_HELPER_API_TOKEN = os.getenv('RAID_HELPER_API_TOKEN', '')
     
     @classmethod
+    @functools.cache
     def validate_config(cls):
-        """Validate that all required configuration is present."""
+        """Validate that all required configuration is present.
+
+        Settings are read once at import, so a successful result is cached;
+        failures raise and are not cached.
+        """
         required_vars = [
             ('DISCORD_BOT_TOKEN', cls.DISCORD_BOT_TOKEN),
             ('GUILD_ID', cls.GUILD_ID),
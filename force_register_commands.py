@@ -6,8 +6,14 @@ Run this if commands disappeared after cleanup.
 
 import asyncio
 import discord
+try:
+    import uvloop
+except ImportError:  # Not available on Windows — fall back to the default loop
+    uvloop = None
 from discord.ext import commands
 from config import Config
+from services import db_connection, bot_state_repository
+from services.bot_state_repository import COMMAND_SYNC_HASH_KEY_PREFIX
 
 async def force_register_commands():
     """Force register all commands."""
@@ -41,6 +47,10 @@ async def force_register_commands():
             print(f"✅ Force synced {len(guild_synced)} commands to guild {Config.GUILD_ID}")
             print(f"Commands synced: {[cmd.name for cmd in guild_synced]}")
             
+            # Forget the last synced payload hash so the main bot re-syncs on next start
+            await bot_state_repository.delete_value(f"{COMMAND_SYNC_HASH_KEY_PREFIX}{Config.GUILD_ID}")
+            print("Cleared stored command sync hash")
+
             print("🎉 Commands should now appear in your Discord server!")
             
         except Exception as e:
@@ -48,6 +58,7 @@ async def force_register_commands():
             import traceback
             traceback.print_exc()
         finally:
+            await db_connection.close_pool()
             await bot.close()
     
     # Start the recovery bot
@@ -59,7 +70,11 @@ if __name__ == "__main__":
     print("")
     
     try:
-        asyncio.run(force_register_commands())
+        if uvloop is not None:
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                runner.run(force_register_commands())
+        else:
+            asyncio.run(force_register_commands())
     except KeyboardInterrupt:
         print("Recovery cancelled by user")
     except Exception as e:
@@ -0,0 +1,7 @@
+-- Migration: Create bot_state key/value table for process-wide markers
+-- (e.g. the last synced slash-command payload hash)
+CREATE TABLE IF NOT EXISTS bot_state (
+    key        VARCHAR(100) PRIMARY KEY,
+    value      TEXT NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 import datetime
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Event model representing a schedule entry."""
     id: Optional[int] = None
@@ -10,6 +10,7 @@ from .loa_config_repository import loa_config_repository
 from .roster_repository import roster_repository
 from .roster_config_repository import roster_config_repository
 from .feedback_repository import feedback_repository
+from .bot_state_repository import bot_state_repository
 from .raid_helper_service import raid_helper_service
 from .log_channel_service import get_log_channel, report_failure
 
@@ -26,6 +27,7 @@ __all__ = [
     'roster_repository',
     'roster_config_repository',
     'feedback_repository',
+    'bot_state_repository',
     'raid_helper_service',
     'get_log_channel',
     'report_failure',
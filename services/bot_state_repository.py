@@ -0,0 +1,36 @@
+from .database_connection import db_connection
+from typing import Optional
+
+# Key (suffixed with the guild ID) holding the last synced slash-command payload hash
+COMMAND_SYNC_HASH_KEY_PREFIX = "command_sync_hash:"
+# ISO-8601 UTC timestamp of the last successful event maintenance pass
+EVENT_MAINTENANCE_KEY = "last_event_maintenance"
+
+
+class BotStateRepository:
+    """Repository for small process-wide key/value state (sync hashes, last-run markers)."""
+
+    async def get_value(self, key: str) -> Optional[str]:
+        """Return the stored value for *key*, or None if unset."""
+        query = "SELECT value FROM bot_state WHERE key = $1;"
+        row = await db_connection.execute_single(query, key)
+        return row["value"] if row else None
+
+    async def set_value(self, key: str, value: str) -> None:
+        """Insert or update the value stored under *key*."""
+        query = """
+        INSERT INTO bot_state (key, value, updated_at)
+        VALUES ($1, $2, NOW())
+        ON CONFLICT (key)
+        DO UPDATE SET value = $2, updated_at = NOW();
+        """
+        await db_connection.execute_command(query, key, value)
+
+    async def delete_value(self, key: str) -> None:
+        """Remove *key* so the next reader sees it as unset."""
+        query = "DELETE FROM bot_state WHERE key = $1;"
+        await db_connection.execute_command(query, key)
+
+
+# Singleton instance
+bot_state_repository = BotStateRepository()
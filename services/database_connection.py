@@ -15,10 +15,13 @@ class DatabaseConnection:
             try:
                 self._connection_pool = await asyncpg.create_pool(
                     Config.NEONDB_CONNECTION_STRING,
-                    min_size=0,
-                    max_size=10,
+                    min_size=Config.DB_POOL_MIN_SIZE,
+                    max_size=Config.DB_POOL_MAX_SIZE,
                     command_timeout=60,
-                    max_inactive_connection_lifetime=300
+                    max_inactive_connection_lifetime=300,
+                    # Per-connection prepared-statement cache so hot reads reuse parsed plans
+                    statement_cache_size=Config.DB_STATEMENT_CACHE_SIZE,
+                    max_cached_statement_lifetime=0,
                 )
                 print("Successfully connected to NeonDB")
             except Exception as e:
@@ -32,6 +35,17 @@ class DatabaseConnection:
             self._connection_pool = None
             print("Database connection pool closed")
     
+    def pool_stats(self) -> Optional[dict]:
+        """Return current pool size/idle counts, or None if no pool exists."""
+        if self._connection_pool is None:
+            return None
+        return {
+            "size": self._connection_pool.get_size(),
+            "idle": self._connection_pool.get_idle_size(),
+            "min": self._connection_pool.get_min_size(),
+            "max": self._connection_pool.get_max_size(),
+        }
+
     async def get_connection(self):
         """Get a connection from the pool."""
         if self._connection_pool is None:
@@ -180,6 +180,16 @@ async def initialize_database():
         ADD COLUMN IF NOT EXISTS events_channel_id BIGINT;
     """
 
+    # ── Bot state (key/value) table ─────────────────────────────────────
+
+    create_bot_state_table_query = """
+    CREATE TABLE IF NOT EXISTS bot_state (
+        key        VARCHAR(100) PRIMARY KEY,
+        value      TEXT NOT NULL,
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    );
+    """
+
     try:
         await db_connection.execute_command(create_events_table_query)
         await db_connection.execute_command(create_index_query)
@@ -203,6 +213,7 @@ async def initialize_database():
         await db_connection.execute_command(create_feedback_posts_index_query)
         await db_connection.execute_command(ensure_feedback_channel_id_query)
         await db_connection.execute_command(ensure_events_channel_id_query)
+        await db_connection.execute_command(create_bot_state_table_query)
         print("Database tables initialized successfully")
         return True
     except Exception as e:
@@ -100,14 +100,14 @@ class EventPopulationService:
         
         # Check if we have events 4 weeks ahead
         future_date = today + timedelta(weeks=4)
-        existing_events = await event_repository.get_events_by_guild_and_date_range(
-            Config.GUILD_ID, 
-            future_date, 
+        has_future_events = await event_repository.has_events_in_range(
+            Config.GUILD_ID,
+            future_date,
             future_date
         )
-        
+
         # If no events exist 4 weeks ahead, populate new range
-        if not existing_events:
+        if not has_future_events:
             return await self.populate_8_week_range(today)
 
         return {"created": 0, "skipped": 0, "failed": 0, "total": 0}
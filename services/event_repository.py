@@ -39,6 +39,15 @@ class EventRepository:
         result = await db_connection.execute_single(query, event_id)
         return Event.from_db_row(result) if result else None
     
+    async def get_events_by_ids(self, ids: List[int]) -> dict[int, Event]:
+        """Get several events in one query. Returns a dict keyed by event ID."""
+        if not ids:
+            return {}
+        query = "SELECT id, guild_id, date, type, name, creator_id, creator_name FROM events WHERE id = ANY($1::int[])"
+
+        results = await db_connection.execute_query(query, list(set(ids)))
+        return {row["id"]: Event.from_db_row(row) for row in results}
+
     async def get_events_by_guild_and_date_range(self, guild_id: int, start_date: date, end_date: date) -> List[Event]:
         """Get events for a guild within a date range."""
         query = """
@@ -51,6 +60,56 @@ class EventRepository:
         results = await db_connection.execute_query(query, guild_id, start_date, end_date)
         return [Event.from_db_row(row) for row in results]
     
+    async def get_unassigned_missions_by_range(self, guild_id: int, start_date: date, end_date: date) -> List[Event]:
+        """Get Mission events with no mission name yet within a date range."""
+        query = """
+        SELECT id, guild_id, date, type, name, creator_id, creator_name
+        FROM events
+        WHERE guild_id = $1 AND date >= $2 AND date <= $3
+          AND type = 'Mission' AND btrim(COALESCE(name, ''), E' \t\r\n') = ''
+        ORDER BY date;
+        """
+        results = await db_connection.execute_query(query, guild_id, start_date, end_date)
+        return [Event.from_db_row(row) for row in results]
+
+    async def get_event_names_in_range(self, guild_id: int, start_date: date, end_date: date) -> set[str]:
+        """Get the distinct non-empty event names (trimmed, lowercased) within a date range."""
+        query = """
+        SELECT DISTINCT lower(btrim(name, E' \t\r\n')) AS name
+        FROM events
+        WHERE guild_id = $1 AND date >= $2 AND date <= $3 AND btrim(name, E' \t\r\n') <> '';
+        """
+        results = await db_connection.execute_query(query, guild_id, start_date, end_date)
+        return {row["name"] for row in results}
+
+    async def has_events_in_range(self, guild_id: int, start_date: date, end_date: date) -> bool:
+        """Return True if the guild has any event within the date range."""
+        query = """
+        SELECT EXISTS (
+            SELECT 1 FROM events
+            WHERE guild_id = $1 AND date >= $2 AND date <= $3
+        );
+        """
+        row = await db_connection.execute_single(query, guild_id, start_date, end_date)
+        return bool(row[0]) if row else False
+
+    async def get_events_fingerprint(self, guild_id: int, start_date: date, end_date: date) -> tuple[int, str]:
+        """Return (row_count, md5) over the displayed columns of events in a date range.
+
+        Cheap change detector for callers that cache output derived from these rows.
+        """
+        query = """
+        SELECT COUNT(*),
+               COALESCE(md5(string_agg(
+                   id::text || '|' || date::text || '|' || type || '|' || COALESCE(name, '') || '|' || COALESCE(creator_name, ''),
+                   ',' ORDER BY id
+               )), '')
+        FROM events
+        WHERE guild_id = $1 AND date >= $2 AND date <= $3;
+        """
+        row = await db_connection.execute_single(query, guild_id, start_date, end_date)
+        return (row[0], row[1]) if row else (0, "")
+
     async def get_event_by_guild_date_type(self, guild_id: int, event_date: date, event_type: str) -> Optional[Event]:
         """Get a specific event by guild, date, and type."""
         query = """
@@ -20,6 +20,9 @@ class ForumTagService:
     def __init__(self):
         self._framework_tags: list[str] = []
         self._composition_tags: list[str] = []
+        # (name, name.lower()) pairs for autocomplete matching, rebuilt with the cache
+        self._framework_tags_lc: tuple[tuple[str, str], ...] = ()
+        self._composition_tags_lc: tuple[tuple[str, str], ...] = ()
         self._all_tags: list[discord.ForumTag] = []
         self._last_fetched: float = 0.0
         self._cache_ttl: float = 86400.0  # 24 hours in seconds
@@ -39,6 +42,16 @@ class ForumTagService:
     def composition_tags(self) -> list[str]:
         return list(self._composition_tags)
 
+    @property
+    def framework_tags_lc(self) -> tuple[tuple[str, str], ...]:
+        """Framework tags as ``(name, name_lower)`` pairs (immutable, not copied)."""
+        return self._framework_tags_lc
+
+    @property
+    def composition_tags_lc(self) -> tuple[tuple[str, str], ...]:
+        """Composition tags as ``(name, name_lower)`` pairs (immutable, not copied)."""
+        return self._composition_tags_lc
+
     @property
     def all_tags(self) -> list[discord.ForumTag]:
         return list(self._all_tags)
@@ -57,6 +70,8 @@ class ForumTagService:
 
         self._framework_tags.sort()
         self._composition_tags.sort()
+        self._framework_tags_lc = tuple((t, t.lower()) for t in self._framework_tags)
+        self._composition_tags_lc = tuple((t, t.lower()) for t in self._composition_tags)
         logger.info(
             f"Tag cache updated: {len(self._framework_tags)} framework tags, "
             f"{len(self._composition_tags)} composition tags"
@@ -2,7 +2,8 @@ import time
 from .database_connection import db_connection
 from typing import Optional
 
-_loa_config_cache: dict[int, tuple[dict, float]] = {}
+# {guild_id: (config or None, timestamp)} — None caches "not configured"
+_loa_config_cache: dict[int, tuple[Optional[dict], float]] = {}
 _LOA_CONFIG_TTL = 300.0  # 5 minutes
 
 
@@ -24,8 +25,8 @@ class LOAConfigRepository:
         query = "SELECT * FROM loa_config WHERE guild_id = $1;"
         row = await db_connection.execute_single(query, guild_id)
         result = dict(row) if row else None
-        if result is not None:
-            _loa_config_cache[guild_id] = (result, now)
+        # set_config invalidates, so a cached miss can't hide a new config
+        _loa_config_cache[guild_id] = (result, now)
         return result
 
     async def set_config(self, guild_id: int, channel_id: int, message_id: int) -> None:
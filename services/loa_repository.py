@@ -13,14 +13,18 @@ class LOARepository:
         start_date: date,
         end_date: date,
         reason: Optional[str] = None,
+        message_id: Optional[int] = None,
+        channel_id: Optional[int] = None,
     ) -> dict:
-        """Create a new LOA record and return it."""
+        """Create a new LOA record (optionally with its announcement message) and return it."""
         query = """
-        INSERT INTO leave_of_absence (guild_id, user_id, start_date, end_date, reason)
-        VALUES ($1, $2, $3, $4, $5)
+        INSERT INTO leave_of_absence (guild_id, user_id, start_date, end_date, reason, message_id, channel_id)
+        VALUES ($1, $2, $3, $4, $5, $6, $7)
         RETURNING *;
         """
-        row = await db_connection.execute_single(query, guild_id, user_id, start_date, end_date, reason)
+        row = await db_connection.execute_single(
+            query, guild_id, user_id, start_date, end_date, reason, message_id, channel_id
+        )
         return dict(row)
 
     async def get_active_loas_by_user(self, guild_id: int, user_id: int) -> list[dict]:
@@ -53,6 +57,17 @@ class LOARepository:
         rows = await db_connection.execute_query(query, guild_id)
         return [dict(r) for r in rows]
 
+    async def get_started_or_ended_loas_by_guild(self, guild_id: int, today: date) -> list[dict]:
+        """Get non-expired LOAs that have started or ended as of *today* (planned ones are skipped)."""
+        query = """
+        SELECT * FROM leave_of_absence
+        WHERE guild_id = $1 AND expired = FALSE
+          AND (start_date <= $2 OR end_date < $2)
+        ORDER BY end_date ASC;
+        """
+        rows = await db_connection.execute_query(query, guild_id, today)
+        return [dict(r) for r in rows]
+
     async def get_loa_by_id(self, loa_id: int) -> Optional[dict]:
         """Get a specific LOA by ID."""
         query = "SELECT * FROM leave_of_absence WHERE id = $1;"
@@ -83,6 +98,11 @@ class LOARepository:
         query = "UPDATE leave_of_absence SET notified = TRUE WHERE id = ANY($1::INT[]);"
         await db_connection.execute_command(query, loa_ids)
 
+    async def mark_cancelled(self, loa_id: int) -> None:
+        """Mark an LOA as expired and notified in one query (cancellations send no DM)."""
+        query = "UPDATE leave_of_absence SET expired = TRUE, notified = TRUE WHERE id = $1;"
+        await db_connection.execute_command(query, loa_id)
+
     async def update_message_info(self, loa_id: int, message_id: int, channel_id: int) -> None:
         """Update the announcement message ID and channel ID for an LOA."""
         query = """
@@ -92,6 +112,17 @@ class LOARepository:
         """
         await db_connection.execute_command(query, loa_id, message_id, channel_id)
 
+    async def update_message_info_bulk(self, rows: list[tuple[int, int, int]]) -> None:
+        """Update announcement info for several LOAs. *rows* are (loa_id, message_id, channel_id)."""
+        if not rows:
+            return
+        query = """
+        UPDATE leave_of_absence
+        SET message_id = $2, channel_id = $3
+        WHERE id = $1;
+        """
+        await db_connection.execute_many(query, rows)
+
     async def get_expired_unnotified(self, guild_id: int) -> list[dict]:
         """Get all expired LOAs that haven't been notified yet."""
         query = """
@@ -1,12 +1,17 @@
+import asyncio
 import discord
+import functools
+import hashlib
 from datetime import datetime, date
 from zoneinfo import ZoneInfo
 from typing import Optional
+from collections import OrderedDict
 import logging
 
 from .loa_repository import loa_repository
 from .loa_config_repository import loa_config_repository
 from .log_channel_service import report_failure
+from .message_debouncer import message_debouncer
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +23,14 @@ ACTIVE_ROLE_ID = 898283677056925756
 UK_TZ = ZoneInfo("Europe/London")
 
 
+# ── Date Formatting ────────────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=4096)
+def format_loa_date(d: date) -> str:
+    """Format a date as DD-MM-YYYY.  Cached — autocomplete formats the same dates per keystroke."""
+    return f"{d.day:02d}-{d.month:02d}-{d.year:04d}"
+
+
 # ── Embed Builders ─────────────────────────────────────────────────────
 
 def build_loa_announcement_embed(
@@ -36,12 +49,12 @@ def build_loa_announcement_embed(
     embed.description = f"**{member.mention}** is on leave of absence."
     embed.add_field(
         name="📅 Start Date",
-        value=f"`{start_date.strftime('%d-%m-%Y')}`",
+        value=f"`{format_loa_date(start_date)}`",
         inline=True,
     )
     embed.add_field(
         name="📅 End Date",
-        value=f"`{end_date.strftime('%d-%m-%Y')}`",
+        value=f"`{format_loa_date(end_date)}`",
         inline=True,
     )
     if reason:
@@ -94,8 +107,8 @@ def build_loa_summary_embed(
         rendered = 0
         for loa in entries:
             user_mention = f"<@{loa['user_id']}>"
-            start_str = loa["start_date"].strftime("%d-%m-%Y")
-            end_str = loa["end_date"].strftime("%d-%m-%Y")
+            start_str = format_loa_date(loa["start_date"])
+            end_str = format_loa_date(loa["end_date"])
             entry = f"👤 {user_mention}\n📅 `{start_str}` → `{end_str}`"
             if loa.get("reason"):
                 entry += f"\n💬 {loa['reason']}"
@@ -142,8 +155,8 @@ def build_expiry_dm_embed(
         timestamp=datetime.now(UK_TZ),
     )
 
-    start_str = loa["start_date"].strftime("%d-%m-%Y")
-    end_str = loa["end_date"].strftime("%d-%m-%Y")
+    start_str = format_loa_date(loa["start_date"])
+    end_str = format_loa_date(loa["end_date"])
 
     description = f"Hey **{member.display_name}**! 👋\n\n"
     description += f"Your leave of absence (`{start_str}` → `{end_str}`) has ended.\n"
@@ -207,11 +220,46 @@ async def find_next_raidhelper_event(
 
 # ── Role Management ────────────────────────────────────────────────────
 
-async def remove_active_role(guild: discord.Guild, user_id: int) -> bool:
-    """Remove the @Active role from a member.  Returns True if removed."""
+async def get_or_fetch_member(guild: discord.Guild, user_id: int) -> Optional[discord.Member]:
+    """Return a member from the cache, falling back to the API.  None if not in the guild."""
+    member = guild.get_member(user_id)
+    if member is not None:
+        return member
     try:
-        member = await guild.fetch_member(user_id)
+        return await guild.fetch_member(user_id)
     except (discord.NotFound, discord.HTTPException):
+        return None
+
+
+async def resolve_members(guild: discord.Guild, user_ids: list[int]) -> dict[int, discord.Member]:
+    """Resolve many members at once: cache first, then one gateway query per 100 misses.
+
+    Users not found (left the guild, or the query timed out) are omitted.
+    """
+    members: dict[int, discord.Member] = {}
+    missing: list[int] = []
+    for user_id in set(user_ids):
+        member = guild.get_member(user_id)
+        if member is not None:
+            members[user_id] = member
+        else:
+            missing.append(user_id)
+
+    for i in range(0, len(missing), 100):  # gateway limit per request
+        chunk = missing[i:i + 100]
+        try:
+            found = await guild.query_members(user_ids=chunk, limit=len(chunk))
+        except asyncio.TimeoutError:
+            logger.warning(f"query_members timed out for {len(chunk)} users")
+            continue
+        members.update((m.id, m) for m in found)
+    return members
+
+
+async def remove_active_role(guild: discord.Guild, user_id: int) -> bool:
+    """Remove the @Active role from a member.  Returns True if removed."""
+    member = await get_or_fetch_member(guild, user_id)
+    if member is None:
         return False
 
     active_role = guild.get_role(ACTIVE_ROLE_ID)
@@ -236,9 +284,8 @@ async def remove_active_role(guild: discord.Guild, user_id: int) -> bool:
 
 async def restore_active_role(guild: discord.Guild, user_id: int) -> bool:
     """Restore the @Active role to a member.  Returns True if added."""
-    try:
-        member = await guild.fetch_member(user_id)
-    except (discord.NotFound, discord.HTTPException):
+    member = await get_or_fetch_member(guild, user_id)
+    if member is None:
         return False
 
     active_role = guild.get_role(ACTIVE_ROLE_ID)
@@ -266,10 +313,65 @@ async def restore_active_role(guild: discord.Guild, user_id: int) -> bool:
     return False
 
 
+async def apply_role_delta(
+    guild: discord.Guild,
+    user_id: int,
+    add: frozenset[int] = frozenset(),
+    remove: frozenset[int] = frozenset(),
+    requires_role_id: Optional[int] = None,
+    reason: Optional[str] = None,
+    member: Optional[discord.Member] = None,
+) -> Optional[set[int]]:
+    """Apply role additions/removals to a member in a single Modify Guild Member call.
+
+    Additions are skipped when *requires_role_id* is given and the member
+    does not hold that role.  Returns the role IDs that were actually added
+    (empty if the member already had them), or None if the member could not
+    be found or the edit failed.  Pass *member* when the caller has already
+    resolved it, to skip the lookup.
+    """
+    if member is None:
+        member = await get_or_fetch_member(guild, user_id)
+    if member is None:
+        return None
+
+    current = {r.id for r in member.roles if not r.is_default()}
+    if requires_role_id is not None and requires_role_id not in current:
+        add = frozenset()
+    target = (current - set(remove)) | set(add)
+    if target == current:
+        return set()
+
+    try:
+        await member.edit(
+            roles=[discord.Object(id=role_id) for role_id in target],
+            reason=reason,
+        )
+    except discord.HTTPException as e:
+        logger.warning(f"Failed to update roles for {user_id}: {e}")
+        await report_failure(
+            guild,
+            "LOA Service",
+            f"Failed to update roles for user {user_id}.",
+            e,
+        )
+        return None
+    return target - current
+
+
 # ── Summary Message Update ─────────────────────────────────────────────
 
-async def update_summary_message(bot: discord.Client, guild_id: int) -> None:
-    """Re-build and edit the bot-owned LOA summary message."""
+# Last summary body applied per guild: {guild_id: (message_id, digest)}
+_summary_digests: dict[int, tuple[int, bytes]] = {}
+
+
+async def update_summary_message(
+    bot: discord.Client, guild_id: int, message: Optional[discord.Message] = None
+) -> None:
+    """Re-build and edit the bot-owned LOA summary message.
+
+    Pass *message* to reuse an already-fetched message and skip the GET.
+    """
     config = await loa_config_repository.get_config(guild_id)
     if not config:
         return
@@ -285,13 +387,20 @@ async def update_summary_message(bot: discord.Client, guild_id: int) -> None:
     active_loas = await loa_repository.get_active_loas_by_guild(guild_id)
     embed = build_loa_summary_embed(active_loas, guild)
 
+    # The footer only carries the refresh time — compare the rendered body
+    digest = hashlib.blake2b(embed.description.encode(), digest_size=16).digest()
+    if _summary_digests.get(guild_id) == (config["message_id"], digest):
+        return
+
     try:
-        msg = await channel.fetch_message(config["message_id"])
+        msg = message if message is not None else channel.get_partial_message(config["message_id"])
         await msg.edit(embed=embed)
+        _summary_digests[guild_id] = (msg.id, digest)
     except discord.NotFound:
         # Message was deleted — recreate it
         msg = await channel.send(embed=embed)
         await loa_config_repository.set_config(guild_id, config["channel_id"], msg.id)
+        _summary_digests[guild_id] = (msg.id, digest)
     except Exception as e:
         logger.error(f"Failed to update LOA summary message: {e}")
         await report_failure(
@@ -302,13 +411,27 @@ async def update_summary_message(bot: discord.Client, guild_id: int) -> None:
         )
 
 
+def schedule_summary_update(bot: discord.Client, guild_id: int, delay: float = 0.5) -> None:
+    """Queue a summary refresh; calls within *delay* seconds collapse into one edit."""
+    message_debouncer.schedule(
+        ("loa_summary", guild_id),
+        lambda: update_summary_message(bot, guild_id),
+        delay=delay,
+    )
+
+
 # ── DM Sender ──────────────────────────────────────────────────────────
 
-async def send_expiry_dm(guild: discord.Guild, loa: dict, role_restored: bool) -> bool:
+async def send_expiry_dm(
+    guild: discord.Guild,
+    loa: dict,
+    role_restored: bool,
+    member: Optional[discord.Member] = None,
+) -> bool:
     """Send an expiry notification DM.  Returns True on success."""
-    try:
-        member = await guild.fetch_member(loa["user_id"])
-    except (discord.NotFound, discord.HTTPException):
+    if member is None:
+        member = await get_or_fetch_member(guild, loa["user_id"])
+    if member is None:
         return False
 
     # Find events link
@@ -343,18 +466,37 @@ async def send_expiry_dm(guild: discord.Guild, loa: dict, role_restored: bool) -
 
 # ── Announcement Deletion ──────────────────────────────────────────────
 
+# Announcement message IDs known to be gone (deleted by us or returned 404),
+# oldest first — lets repeat calls skip the round-trip.
+_dead_messages: OrderedDict[int, None] = OrderedDict()
+_DEAD_MESSAGES_MAX = 4096
+
+
+def _mark_dead(message_id: int) -> None:
+    _dead_messages[message_id] = None
+    _dead_messages.move_to_end(message_id)
+    if len(_dead_messages) > _DEAD_MESSAGES_MAX:
+        _dead_messages.popitem(last=False)
+
+
 async def delete_loa_announcement(guild: discord.Guild, loa: dict) -> bool:
     """Delete the announcement embed for an LOA.  Returns True on success."""
     if not loa.get("message_id") or not loa.get("channel_id"):
         return False
+    if loa["message_id"] in _dead_messages:
+        return False
 
+    channel = guild.get_channel(loa["channel_id"])
+    if not channel:
+        return False
     try:
-        channel = guild.get_channel(loa["channel_id"])
-        if channel:
-            msg = await channel.fetch_message(loa["message_id"])
-            await msg.delete()
-            return True
-    except (discord.NotFound, discord.HTTPException):
+        # Deleting only needs the ID — skip the GET round-trip
+        await channel.get_partial_message(loa["message_id"]).delete()
+        _mark_dead(loa["message_id"])
+        return True
+    except discord.NotFound:
+        _mark_dead(loa["message_id"])
+    except discord.HTTPException:
         pass
 
     return False
@@ -0,0 +1,59 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class MessageDebouncer:
+    """Coalesce bursts of message edits into one call per key.
+
+    Each ``schedule()`` for a key cancels the pending call for that key and
+    restarts the delay, so N triggers within the window produce a single
+    edit once things go quiet.
+    """
+
+    def __init__(self, default_delay: float = 2.0):
+        self.default_delay = default_delay
+        self._pending: dict[Hashable, asyncio.TimerHandle] = {}
+        self._running: set[asyncio.Task] = set()
+
+    def schedule(
+        self,
+        key: Hashable,
+        coro_factory: Callable[[], Awaitable],
+        delay: float | None = None,
+    ) -> None:
+        """Run ``coro_factory()`` after *delay* seconds unless rescheduled first."""
+        handle = self._pending.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+
+        loop = asyncio.get_running_loop()
+        self._pending[key] = loop.call_later(
+            self.default_delay if delay is None else delay,
+            self._fire, key, coro_factory,
+        )
+
+    def _fire(self, key: Hashable, coro_factory: Callable[[], Awaitable]) -> None:
+        self._pending.pop(key, None)
+        task = asyncio.create_task(self._run(key, coro_factory))
+        # Hold a reference so the task isn't garbage-collected mid-flight
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, key: Hashable, coro_factory: Callable[[], Awaitable]) -> None:
+        try:
+            await coro_factory()
+        except Exception as e:
+            logger.warning("Debounced edit for %s failed: %s", key, e, exc_info=True)
+
+    def cancel_all(self) -> None:
+        """Drop every pending (not yet started) call."""
+        for handle in self._pending.values():
+            handle.cancel()
+        self._pending.clear()
+
+
+# Singleton instance
+message_debouncer = MessageDebouncer()
@@ -0,0 +1,49 @@
+import time
+from typing import Optional
+
+# Shared between cog extensions: each extension is loaded as its own module
+# object, so caches that several cogs invalidate must live in services/.
+
+# Unassigned upcoming Mission events: {guild_id: (list[Event], timestamp)}
+_event_cache: dict[int, tuple[list, float]] = {}
+_EVENT_CACHE_TTL = 30.0  # seconds
+
+
+def get_cached_unassigned_events(guild_id: int) -> Optional[list]:
+    """Return the guild's cached unassigned-events list, or None if missing or stale."""
+    cached = _event_cache.get(guild_id)
+    if cached and time.monotonic() - cached[1] < _EVENT_CACHE_TTL:
+        return cached[0]
+    return None
+
+
+def cache_unassigned_events(guild_id: int, events: list) -> None:
+    _event_cache[guild_id] = (events, time.monotonic())
+
+
+def invalidate_unassigned_events(guild_id: int) -> None:
+    """Drop the cached unassigned-events list after an event is named, cleared or cancelled."""
+    _event_cache.pop(guild_id, None)
+
+
+# /cancelpoll autocomplete labels, pre-lowercased for matching:
+# {guild_id: (timestamp, [(poll_id, label, label_lower), ...])}
+_poll_ac_cache: dict[int, tuple[float, list[tuple[int, str, str]]]] = {}
+_POLL_AC_CACHE_TTL = 15.0  # seconds
+
+
+def get_cached_poll_choices(guild_id: int) -> Optional[list[tuple[int, str, str]]]:
+    """Return the guild's cached poll autocomplete labels, or None if missing or stale."""
+    cached = _poll_ac_cache.get(guild_id)
+    if cached and time.monotonic() - cached[0] < _POLL_AC_CACHE_TTL:
+        return cached[1]
+    return None
+
+
+def cache_poll_choices(guild_id: int, labels: list[tuple[int, str, str]]) -> None:
+    _poll_ac_cache[guild_id] = (time.monotonic(), labels)
+
+
+def invalidate_poll_choices(guild_id: int) -> None:
+    """Drop cached autocomplete labels after a poll is created, cancelled or resolved."""
+    _poll_ac_cache.pop(guild_id, None)
@@ -74,6 +74,37 @@ class MissionPollRepository:
             results = await db_connection.execute_query(query)
         return [self._row_to_dict(row) for row in results]
 
+    async def get_ended_polls(self, before: datetime) -> list[dict]:
+        """Get active polls whose end time is at or before *before*."""
+        query = """
+        SELECT id, guild_id, poll_message_id, channel_id, target_event_id,
+               framework_filter, composition_filter, mission_thread_ids,
+               poll_end_time, status, winning_thread_id, created_by, created_at,
+               links_message_id
+        FROM mission_polls WHERE status = 'active' AND poll_end_time <= $1
+        ORDER BY poll_end_time;
+        """
+        results = await db_connection.execute_query(query, before)
+        return [self._row_to_dict(row) for row in results]
+
+    async def get_active_polls_with_events(self, guild_id: int) -> list[dict]:
+        """Get a guild's active polls with their target event's date (``event_date``) joined in.
+
+        ``event_date`` is None if the target event no longer exists.
+        """
+        query = """
+        SELECT mp.id, mp.guild_id, mp.poll_message_id, mp.channel_id, mp.target_event_id,
+               mp.framework_filter, mp.composition_filter, mp.mission_thread_ids,
+               mp.poll_end_time, mp.status, mp.winning_thread_id, mp.created_by, mp.created_at,
+               mp.links_message_id, e.date AS event_date
+        FROM mission_polls mp
+        LEFT JOIN events e ON e.id = mp.target_event_id
+        WHERE mp.status = 'active' AND mp.guild_id = $1
+        ORDER BY mp.poll_end_time;
+        """
+        results = await db_connection.execute_query(query, guild_id)
+        return [{**self._row_to_dict(row), "event_date": row["event_date"]} for row in results]
+
     async def get_active_poll_for_event(self, target_event_id: int) -> Optional[dict]:
         """Check if there's already an active poll for a given event."""
         query = """
@@ -107,6 +138,41 @@ class MissionPollRepository:
         await db_connection.execute_command(query, poll_id, winning_thread_id)
         logger.info(f"Poll #{poll_id} marked completed, winner thread: {winning_thread_id}")
 
+    async def finalize_poll(
+        self,
+        poll_id: int,
+        event_id: int,
+        mission_name: str,
+        creator_name: str,
+        winning_thread_id: int,
+        creator_id: int = 0,
+    ) -> bool:
+        """Assign the winning mission to the event and mark the poll completed.
+
+        Both updates run as one statement, so they commit together in a
+        single round trip. The poll is only marked completed if the event
+        row was updated. Returns True on success.
+        """
+        query = """
+        WITH ev AS (
+            UPDATE events SET name = $2, creator_id = $3, creator_name = $4
+            WHERE id = $1
+            RETURNING id
+        ), poll AS (
+            UPDATE mission_polls SET status = 'completed', winning_thread_id = $6
+            WHERE id = $5 AND EXISTS (SELECT 1 FROM ev)
+            RETURNING id
+        )
+        SELECT EXISTS (SELECT 1 FROM ev) AS updated;
+        """
+        row = await db_connection.execute_single(
+            query, event_id, mission_name, creator_id, creator_name, poll_id, winning_thread_id
+        )
+        updated = bool(row and row["updated"])
+        if updated:
+            logger.info(f"Poll #{poll_id} marked completed, winner thread: {winning_thread_id}")
+        return updated
+
     async def mark_failed(self, poll_id: int):
         """Mark a poll as failed."""
         query = """
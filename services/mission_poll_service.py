@@ -1,4 +1,5 @@
 import discord
+import functools
 import re
 import random
 import logging
@@ -36,8 +37,9 @@ def ordinal(n: int) -> str:
     return f"{n}{suffix}"
 
 
+@functools.lru_cache(maxsize=1024)
 def format_event_date(event_date: date) -> str:
-    """Format a date as 'Thursday 19th February'."""
+    """Format a date as 'Thursday 19th February'.  Cached — poll paths format the same dates repeatedly."""
     day_name = event_date.strftime("%A")
     day_ord = ordinal(event_date.day)
     month_name = event_date.strftime("%B")
@@ -195,9 +197,9 @@ def select_with_day_priority(
       in the priority pool.
     - The priority pool fills as many slots as possible (up to *count*).
     - Any remaining slots are filled from the rest of the pool.
-    - Both pools are independently shuffled before selection.
+    - Both pools are sampled independently.
     - If *day_tag* is None, or no threads carry the tag, all threads are
-      shuffled uniformly (identical to the previous behaviour).
+      sampled uniformly.
 
     Returns:
         (selected, excluded) — the chosen threads and the leftover threads.
@@ -206,21 +208,24 @@ def select_with_day_priority(
         return list(threads), []
 
     if not day_tag:
-        shuffled = list(threads)
-        random.shuffle(shuffled)
-        return shuffled[:count], shuffled[count:]
+        # sample() picks k without shuffling the whole pool
+        selected = random.sample(threads, count)
+        selected_ids = {t.id for t in selected}
+        return selected, [t for t in threads if t.id not in selected_ids]
 
     day_lower = day_tag.lower()
-    priority = [t for t in threads if day_lower in [tag.lower() for tag in get_thread_tags(t)]]
-    rest = [t for t in threads if t not in priority]
-
-    random.shuffle(priority)
-    random.shuffle(rest)
+    priority = []
+    rest = []
+    for t in threads:
+        if any(tag.lower() == day_lower for tag in get_thread_tags(t)):
+            priority.append(t)
+        else:
+            rest.append(t)
 
-    selected = priority[:count]
-    if len(selected) < count:
-        needed = count - len(selected)
-        selected = selected + rest[:needed]
+    if len(priority) >= count:
+        selected = random.sample(priority, count)
+    else:
+        selected = random.sample(priority, len(priority)) + random.sample(rest, count - len(priority))
 
     selected_ids = {t.id for t in selected}
     excluded = [t for t in threads if t.id not in selected_ids]
@@ -240,13 +245,8 @@ async def get_excluded_thread_ids(guild_id: int, threads: list[discord.Thread],
     """
     today = date.today()
     start_date = today - timedelta(weeks=weeks)
-    events = await event_repository.get_events_by_guild_and_date_range(guild_id, start_date, today)
-
-    # Collect non-empty event names from the lookback window
-    recent_names = set()
-    for ev in events:
-        if ev.name and ev.name.strip():
-            recent_names.add(ev.name.strip().lower())
+    # Non-empty event names from the lookback window, normalised in SQL
+    recent_names = await event_repository.get_event_names_in_range(guild_id, start_date, today)
 
     if not recent_names:
         return set(), []
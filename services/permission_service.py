@@ -0,0 +1,27 @@
+import discord
+
+# Roles named "editor" per guild: {guild_id: frozenset of role IDs} (empty = no such role)
+_editor_role_ids: dict[int, frozenset[int]] = {}
+
+
+def editor_role_ids(guild: discord.Guild) -> frozenset[int]:
+    """Return the IDs of every role named "editor" in the guild, resolving them on first use."""
+    ids = _editor_role_ids.get(guild.id)
+    if ids is None:
+        ids = frozenset(r.id for r in guild.roles if r.name.strip().lower() == "editor")
+        _editor_role_ids[guild.id] = ids
+    return ids
+
+
+def invalidate_editor_role(guild_id: int) -> None:
+    """Drop the cached @Editor roles after a role is created, renamed or deleted."""
+    _editor_role_ids.pop(guild_id, None)
+
+
+def is_admin_or_editor(member: discord.Member) -> bool:
+    """Return True if one of *member*'s roles grants administrator, or is an @Editor role."""
+    # Role-based like the original check — the guild owner without an admin
+    # role is deliberately not treated as an admin here
+    if any(r.permissions.administrator for r in member.roles):
+        return True
+    return any(member.get_role(role_id) is not None for role_id in editor_role_ids(member.guild))
@@ -28,6 +28,30 @@ class RaidHelperService:
     The event ID in Raid-Helper is the Discord message ID of the event post.
     """
 
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use.
+
+        Reusing one session keeps TCP/TLS connections and DNS lookups alive
+        between Raid-Helper calls instead of reconnecting for each request.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=20, ttl_dns_cache=300, keepalive_timeout=75
+                ),
+                timeout=aiohttp.ClientTimeout(total=15),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session (called on bot shutdown)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     @property
     def _auth_headers(self) -> dict:
         """Return authorization headers for server-level endpoints."""
@@ -51,32 +75,30 @@ class RaidHelperService:
             return []
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        # The response may be a dict with a list inside or a raw list
-                        if isinstance(data, list):
-                            events = data
-                        elif isinstance(data, dict):
-                            logger.debug(
-                                f"Raid-Helper response keys: {list(data.keys())}"
-                            )
-                            events = data.get("postedEvents", data.get("events", []))
-                        else:
-                            events = []
-                        logger.info(
-                            f"Fetched {len(events)} events from Raid-Helper for server {server_id}"
+            session = await self._get_session()
+            async with session.get(url, headers=headers) as resp:
+                if resp.status == 200:
+                    data = await resp.json()
+                    # The response may be a dict with a list inside or a raw list
+                    if isinstance(data, list):
+                        events = data
+                    elif isinstance(data, dict):
+                        logger.debug(
+                            f"Raid-Helper response keys: {list(data.keys())}"
                         )
-                        return events
+                        events = data.get("postedEvents", data.get("events", []))
                     else:
-                        body = await resp.text()
-                        logger.warning(
-                            f"Raid-Helper server events API returned {resp.status}: {body[:200]}"
-                        )
-                        return []
+                        events = []
+                    logger.info(
+                        f"Fetched {len(events)} events from Raid-Helper for server {server_id}"
+                    )
+                    return events
+                else:
+                    body = await resp.text()
+                    logger.warning(
+                        f"Raid-Helper server events API returned {resp.status}: {body[:200]}"
+                    )
+                    return []
         except Exception as e:
             logger.warning(f"Raid-Helper server events request failed: {e}")
             return []
@@ -127,23 +149,21 @@ class RaidHelperService:
         """
         url = f"{RAID_HELPER_API}/events/{event_message_id}"
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url, timeout=aiohttp.ClientTimeout(total=15)
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        logger.info(
-                            f"Fetched Raid-Helper event {event_message_id}: "
-                            f"{data.get('title', '?')}"
-                        )
-                        return data
-                    else:
-                        logger.warning(
-                            f"Raid-Helper API returned {resp.status} "
-                            f"for event {event_message_id}"
-                        )
-                        return None
+            session = await self._get_session()
+            async with session.get(url) as resp:
+                if resp.status == 200:
+                    data = await resp.json()
+                    logger.info(
+                        f"Fetched Raid-Helper event {event_message_id}: "
+                        f"{data.get('title', '?')}"
+                    )
+                    return data
+                else:
+                    logger.warning(
+                        f"Raid-Helper API returned {resp.status} "
+                        f"for event {event_message_id}"
+                    )
+                    return None
         except Exception as e:
             logger.warning(
                 f"Raid-Helper API request failed for event {event_message_id}: {e}"
@@ -245,26 +265,21 @@ class RaidHelperService:
             return True
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.patch(
-                    url,
-                    json=payload,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=15),
-                ) as resp:
-                    if resp.status in (200, 204):
-                        logger.info(
-                            f"Updated Raid-Helper event {event_message_id}: "
-                            f"fields={list(payload.keys())}"
-                        )
-                        return True
-                    else:
-                        body = await resp.text()
-                        logger.warning(
-                            f"Raid-Helper PATCH returned {resp.status} "
-                            f"for event {event_message_id}: {body[:300]}"
-                        )
-                        return False
+            session = await self._get_session()
+            async with session.patch(url, json=payload, headers=headers) as resp:
+                if resp.status in (200, 204):
+                    logger.info(
+                        f"Updated Raid-Helper event {event_message_id}: "
+                        f"fields={list(payload.keys())}"
+                    )
+                    return True
+                else:
+                    body = await resp.text()
+                    logger.warning(
+                        f"Raid-Helper PATCH returned {resp.status} "
+                        f"for event {event_message_id}: {body[:300]}"
+                    )
+                    return False
         except Exception as e:
             logger.warning(
                 f"Raid-Helper PATCH request failed for event {event_message_id}: {e}"
@@ -0,0 +1,41 @@
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """Async token bucket: at most *rate* acquisitions per *per* seconds.
+
+    Use as ``async with bucket: ...``.  Idle periods let the bucket refill to
+    its full capacity, so short bursts go through immediately; sustained
+    bursts are spaced out just enough to stay under the rate.
+    """
+
+    def __init__(self, rate: float, per: float = 1.0):
+        self.capacity = float(rate)
+        self._fill_rate = rate / per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._fill_rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._fill_rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+# Shared bucket for bulk Discord REST traffic (global limit is 50/s — leave headroom)
+discord_rate_limiter = AsyncTokenBucket(rate=45, per=1.0)
@@ -1,4 +1,5 @@
 import discord
+import asyncio
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from typing import Optional
@@ -58,21 +59,28 @@ def _extract_name_and_rank(member: discord.Member) -> tuple[str, Optional[str],
     If no rank role is found, ``rank_prefix`` and ``rank_full_name`` are None
     and ``rank_order`` is 999.
     """
+    return _extract_name_and_rank_from(member.display_name, [role.id for role in member.roles])
+
+
+def _extract_name_and_rank_from(
+    display_name: str, role_ids,
+) -> tuple[str, Optional[str], Optional[str], int]:
+    """Plain-data version of :func:`_extract_name_and_rank` (safe to run in a thread)."""
     # 1. Find the highest rank role the member has
     rank_prefix: Optional[str] = None
     rank_name: Optional[str] = None
     rank_order: int = 999
 
-    for role in member.roles:
-        if role.id in RANK_BY_ROLE_ID:
-            prefix, name, order, _emoji = RANK_BY_ROLE_ID[role.id]
+    for role_id in role_ids:
+        if role_id in RANK_BY_ROLE_ID:
+            prefix, name, order, _emoji = RANK_BY_ROLE_ID[role_id]
             if order < rank_order:
                 rank_prefix = prefix
                 rank_name = name
                 rank_order = order
 
     # 2. Strip rank prefix from display name to get the "clean" name
-    display = member.display_name.strip()
+    display = display_name.strip()
 
     if rank_prefix:
         # Check if the display name starts with the rank prefix
@@ -83,7 +91,7 @@ def _extract_name_and_rank(member: discord.Member) -> tuple[str, Optional[str],
 
     # Fallback: if stripping left an empty string, use the original
     if not display:
-        display = member.display_name.strip()
+        display = display_name.strip()
 
     return display, rank_prefix, rank_name, rank_order
 
@@ -126,53 +134,60 @@ def _format_member_line(
 
 # ── Scanner ────────────────────────────────────────────────────────────
 
-async def scan_roster(guild: discord.Guild) -> dict:
-    """Scan all guild members and upsert the roster table.
+# Last scan per guild: {guild_id: (input_hash, summary)}.  When the member
+# snapshot and LOA set are unchanged (e.g. after a reconnect) the DB writes
+# are skipped and the previous summary is returned.
+_scan_cache: dict[int, tuple[int, dict]] = {}
+
 
-    Returns a summary dict with counts.
+def snapshot_members(guild: discord.Guild) -> tuple[tuple[int, str, tuple[int, ...]], ...]:
+    """Copy ``(id, display_name, role_ids)`` for every non-bot member in the cache.
+
+    Uses the cached ``guild.members`` — no member request is sent.
     """
-    member_role  = guild.get_role(MEMBER_ROLE_ID)
-    active_role  = guild.get_role(ACTIVE_ROLE_ID)
-    reserve_role = guild.get_role(RESERVE_ROLE_ID)
+    return tuple(
+        (m.id, m.display_name, tuple(r.id for r in m.roles))
+        for m in guild.members
+        if not m.bot
+    )
 
-    if not member_role:
-        logger.warning("@Member role not found in guild")
-        return {"total": 0, "active": 0, "reserve": 0, "updated": 0, "removed": 0}
 
-    # Fetch currently-active LOA user IDs (excludes future LOAs)
-    active_loas = await loa_repository.get_currently_active_loas_by_guild(guild.id)
-    loa_user_ids = {loa["user_id"] for loa in active_loas}
+def compute_roster_rows(
+    guild_id: int,
+    members: tuple[tuple[int, str, tuple[int, ...]], ...],
+    loa_user_ids: frozenset[int],
+) -> tuple[list[tuple], list[int], int, int]:
+    """Build roster rows from a member snapshot.
 
+    Pure and CPU-only so it can run in a thread executor.  Returns
+    ``(rows, present_user_ids, active_count, reserve_count)``.
+    """
     present_user_ids: list[int] = []
     rows: list[tuple] = []
     active_count = 0
     reserve_count = 0
 
-    hellfish_role = guild.get_role(HELLFISH_ROLE_ID)
-    aac_role      = guild.get_role(AAC_ROLE_ID)
-
-    for member in guild.members:
-        if member.bot:
-            continue
-        if member_role not in member.roles:
+    for member_id, display_name, role_ids in members:
+        role_set = set(role_ids)
+        if MEMBER_ROLE_ID not in role_set:
             continue
 
-        present_user_ids.append(member.id)
+        present_user_ids.append(member_id)
 
-        clean_name, rank_prefix, rank_name, rank_order = _extract_name_and_rank(member)
+        clean_name, rank_prefix, rank_name, rank_order = _extract_name_and_rank_from(display_name, role_ids)
 
-        is_active  = active_role is not None and active_role in member.roles
-        is_reserve = reserve_role is not None and reserve_role in member.roles
+        is_active  = ACTIVE_ROLE_ID in role_set
+        is_reserve = RESERVE_ROLE_ID in role_set
 
         # Determine subgroup — check regardless of active role because
         # LOA members lose @Active but keep their subgroup role (FH/AAC)
         subgroup: Optional[str] = None
-        if hellfish_role and hellfish_role in member.roles:
+        if HELLFISH_ROLE_ID in role_set:
             subgroup = "Flying Hellfish"
-        elif aac_role and aac_role in member.roles:
+        elif AAC_ROLE_ID in role_set:
             subgroup = "AAC"
 
-        on_loa = member.id in loa_user_ids
+        on_loa = member_id in loa_user_ids
 
         # LOA members with a subgroup should still appear in the active
         # roster (shown with strikethrough) even though they lose @Active
@@ -184,10 +199,44 @@ async def scan_roster(guild: discord.Guild) -> dict:
             reserve_count += 1
 
         rows.append((
-            guild.id, member.id, clean_name, rank_prefix, rank_name,
+            guild_id, member_id, clean_name, rank_prefix, rank_name,
             rank_order, effective_active, is_reserve, subgroup, on_loa,
         ))
 
+    return rows, present_user_ids, active_count, reserve_count
+
+
+async def scan_roster(guild: discord.Guild, force: bool = False) -> dict:
+    """Scan all guild members and upsert the roster table.
+
+    Returns a summary dict with counts.  Pass ``force=True`` to write to the
+    DB even when the member snapshot is unchanged since the last scan.
+    """
+    if not guild.get_role(MEMBER_ROLE_ID):
+        logger.warning("@Member role not found in guild")
+        return {"total": 0, "active": 0, "reserve": 0, "updated": 0, "removed": 0}
+
+    # Fetch currently-active LOA user IDs (excludes future LOAs)
+    active_loas = await loa_repository.get_currently_active_loas_by_guild(guild.id)
+    loa_user_ids = frozenset(loa["user_id"] for loa in active_loas)
+
+    # Chunking is disabled at startup; a partial cache would make
+    # remove_absent_members drop members that simply aren't loaded yet.
+    if not guild.chunked:
+        await guild.chunk()
+
+    members = snapshot_members(guild)
+    input_hash = hash((members, loa_user_ids))
+    cached = _scan_cache.get(guild.id)
+    if not force and cached is not None and cached[0] == input_hash:
+        logger.info(f"Roster unchanged for {guild.name} — skipping scan")
+        return cached[1]
+
+    # Row building walks every member; keep it off the event loop
+    rows, present_user_ids, active_count, reserve_count = await asyncio.get_running_loop().run_in_executor(
+        None, compute_roster_rows, guild.id, members, loa_user_ids
+    )
+
     # Single bulk upsert instead of N individual round-trips
     await roster_repository.bulk_upsert_members(rows)
 
@@ -201,6 +250,7 @@ async def scan_roster(guild: discord.Guild) -> dict:
         "updated": len(rows),
         "removed": removed,
     }
+    _scan_cache[guild.id] = (input_hash, summary)
     logger.info(f"Roster scan complete for {guild.name}: {summary}")
     return summary
 
@@ -387,8 +437,13 @@ async def build_roster_embeds(guild_id: int) -> list[discord.Embed]:
 
 # ── Summary Message Update ─────────────────────────────────────────────
 
-async def update_roster_message(bot: discord.Client, guild_id: int) -> None:
-    """Re-build and edit the bot-owned Roster embed message."""
+async def update_roster_message(
+    bot: discord.Client, guild_id: int, message: Optional[discord.Message] = None
+) -> None:
+    """Re-build and edit the bot-owned Roster embed message.
+
+    Pass *message* to reuse an already-fetched message and skip the GET.
+    """
     config = await roster_config_repository.get_config(guild_id)
     if not config:
         return
@@ -404,7 +459,7 @@ async def update_roster_message(bot: discord.Client, guild_id: int) -> None:
     embeds = await build_roster_embeds(guild_id)
 
     try:
-        msg = await channel.fetch_message(config["message_id"])
+        msg = message if message is not None else channel.get_partial_message(config["message_id"])
         await msg.edit(embeds=embeds)
     except discord.NotFound:
         # Message was deleted — recreate it
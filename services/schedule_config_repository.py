@@ -1,7 +1,9 @@
 import time
+from typing import Optional
 from .database_connection import db_connection
 
-_config_cache: dict[int, tuple[dict, float]] = {}
+# {guild_id: (config or None, timestamp)} — None caches "not configured"
+_config_cache: dict[int, tuple[Optional[dict], float]] = {}
 _CONFIG_TTL = 300.0  # 5 minutes
 
 
@@ -67,6 +69,8 @@ class ScheduleConfigRepository:
             }
             _config_cache[guild_id] = (config, now)
             return config
+        # Every write path invalidates, so a cached miss can't hide a new config
+        _config_cache[guild_id] = (None, now)
         return None
 
 schedule_config_repository = ScheduleConfigRepository()
@@ -0,0 +1,62 @@
+import time
+import logging
+from datetime import date
+
+import discord
+
+from .event_repository import event_repository
+from .schedule_config_repository import schedule_config_repository
+from .schedule_embed_service import build_schedule_embed, schedule_date_range, current_week_window
+
+logger = logging.getLogger(__name__)
+
+# Rebuilt embeds per guild: {guild_id: (fingerprint, embed, timestamp)}
+_embed_cache: dict[int, tuple[tuple, discord.Embed, float]] = {}
+# Fingerprint last written to each schedule message: {message_id: (fingerprint, timestamp)}
+_applied: dict[int, tuple[tuple, float]] = {}
+# Upper bound on reuse — briefing-forum threads are not part of the fingerprint
+_SCHEDULE_EMBED_TTL = 900.0  # 15 minutes
+
+
+async def _schedule_fingerprint(guild: discord.Guild) -> tuple:
+    """Everything the schedule embed depends on, apart from the briefing forum threads."""
+    today = date.today()
+    start_date, end_date = schedule_date_range(today)
+    count, digest = await event_repository.get_events_fingerprint(guild.id, start_date, end_date)
+    config = await schedule_config_repository.get_config(guild.id)
+    briefing_channel_id = config["briefing_channel_id"] if config else None
+    week_start = current_week_window(today)[0]
+    return (today, week_start, briefing_channel_id, count, digest)
+
+
+async def get_schedule_embed(guild: discord.Guild) -> tuple[discord.Embed, tuple]:
+    """Return ``(embed, fingerprint)``, rebuilding only when the schedule changed."""
+    now = time.monotonic()
+    fingerprint = await _schedule_fingerprint(guild)
+    cached = _embed_cache.get(guild.id)
+    if cached is not None:
+        cached_fp, embed, ts = cached
+        if cached_fp == fingerprint and now - ts < _SCHEDULE_EMBED_TTL:
+            return embed, fingerprint
+
+    embed = await build_schedule_embed(guild)
+    _embed_cache[guild.id] = (fingerprint, embed, now)
+    return embed, fingerprint
+
+
+async def refresh_schedule_message(guild: discord.Guild, msg: discord.PartialMessage) -> bool:
+    """Edit *msg* with the current schedule embed.
+
+    Skips the Discord PATCH when this process already wrote the same
+    fingerprint to the message within the TTL.  Returns True if edited.
+    """
+    embed, fingerprint = await get_schedule_embed(guild)
+    now = time.monotonic()
+    applied = _applied.get(msg.id)
+    if applied is not None and applied[0] == fingerprint and now - applied[1] < _SCHEDULE_EMBED_TTL:
+        logger.info(f"Schedule message for guild {guild.name} already up to date — skipping edit")
+        return False
+
+    await msg.edit(embed=embed)
+    _applied[msg.id] = (fingerprint, now)
+    return True
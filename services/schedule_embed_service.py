@@ -11,8 +11,7 @@ async def build_schedule_embed(guild):
     logger = logging.getLogger("schedule_embed_service")
     today = date.today()
     now_local = datetime.now()
-    start_date = today - timedelta(weeks=2)
-    end_date = today + timedelta(weeks=4)
+    start_date, end_date = schedule_date_range(today)
     events = await event_repository.get_events_by_guild_and_date_range(guild.id, start_date, end_date)
 
     # Get config for this guild (for briefing_channel_id)
@@ -87,18 +86,7 @@ async def build_schedule_embed(guild):
     last_month = None
     # Calculate current week range with custom cutoff: Sunday 20:00 UTC
     from datetime import timezone, time as dtime
-    now_utc = datetime.utcnow().replace(tzinfo=timezone.utc)
-    # Find the most recent Monday
-    week_start = today - timedelta(days=today.weekday())
-    # Find the next Sunday
-    week_end_date = week_start + timedelta(days=6)
-    # Set cutoff to Sunday 20:00 UTC
-    week_end_cutoff = datetime.combine(week_end_date, dtime(hour=20, minute=0, tzinfo=timezone.utc))
-    # If now is after the cutoff, move to next week
-    if now_utc > week_end_cutoff:
-        week_start = week_start + timedelta(days=7)
-        week_end_date = week_start + timedelta(days=6)
-        week_end_cutoff = datetime.combine(week_end_date, dtime(hour=20, minute=0, tzinfo=timezone.utc))
+    week_start, week_end_date, week_end_cutoff = current_week_window(today)
     for week_start_dt in week_keys:
         week_events = week_groups[week_start_dt]
         week_num = week_start_dt.isocalendar()[1]
@@ -163,6 +151,32 @@ async def build_schedule_embed(guild):
     embed.set_footer(text="")
     return embed
 
+def schedule_date_range(today: date) -> tuple[date, date]:
+    """Return the (start, end) dates covered by the schedule embed."""
+    return today - timedelta(weeks=2), today + timedelta(weeks=4)
+
+
+def current_week_window(today: date) -> tuple[date, date, datetime]:
+    """Return (week_start, week_end_date, week_end_cutoff) for the highlighted week.
+
+    The week runs Monday to Sunday and rolls over at Sunday 20:00 UTC.
+    """
+    from datetime import timezone, time as dtime
+    now_utc = datetime.utcnow().replace(tzinfo=timezone.utc)
+    # Find the most recent Monday
+    week_start = today - timedelta(days=today.weekday())
+    # Find the next Sunday
+    week_end_date = week_start + timedelta(days=6)
+    # Set cutoff to Sunday 20:00 UTC
+    week_end_cutoff = datetime.combine(week_end_date, dtime(hour=20, minute=0, tzinfo=timezone.utc))
+    # If now is after the cutoff, move to next week
+    if now_utc > week_end_cutoff:
+        week_start = week_start + timedelta(days=7)
+        week_end_date = week_start + timedelta(days=6)
+        week_end_cutoff = datetime.combine(week_end_date, dtime(hour=20, minute=0, tzinfo=timezone.utc))
+    return week_start, week_end_date, week_end_cutoff
+
+
 async def _fetch_forum_threads(guild, forum_channel_id, logger=None):
     """Fetch all active and archived threads from a forum channel once.
 
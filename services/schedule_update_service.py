@@ -22,11 +22,10 @@ class ScheduleUpdateService:
         channel = self.bot.get_channel(channel_id)
         if not channel:
             return False
+        # Update the schedule embed for this guild — editing only needs the ID
+        embed = await build_schedule_embed(channel.guild)
         try:
-            message = await channel.fetch_message(message_id)
-        except Exception:
+            await channel.get_partial_message(message_id).edit(embed=embed)
+        except discord.NotFound:
             return False
-        # Update the schedule embed for this guild
-        embed = await build_schedule_embed(channel.guild)
-        await message.edit(embed=embed)
         return True
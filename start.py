@@ -4,15 +4,14 @@ Entry point for GOL Discord Bot.
 This file serves as the main entry point for hosting platforms like fps.ms.
 """
 
-import asyncio
 import sys
 import os
-from bot import main
+from bot import run
 
 if __name__ == "__main__":
     try:
         # Run the bot
-        asyncio.run(main())
+        run()
     except KeyboardInterrupt:
         print("Bot stopped by user")
         sys.exit(0)